@@ -1,38 +1,135 @@
+import argparse
 import asyncio
-from google.adk.agents import LlmAgent
-from google.adk.runners import Runner
-from google.adk.sessions.in_memory_session_service import InMemorySessionService
-from google.adk.tools import FunctionTool
+import functools
+import itertools
+import sys
 from sprint_tools import update_sprint_task_status, worker_tools
 
-async def main():
-    print("Initializing...")
-    session_service = InMemorySessionService()
-    
+PROBE_TIMEOUT = 30  # seconds, so a hung probe can't wedge the whole script
+
+# ADK modules are imported inside the probes that need them, so the
+# direct-call probe doesn't load LlmAgent, Runner or the session service.
+# (sprint_tools still imports google.adk.tools, and with it the agents package.)
+def _new_session_service():
+    from google.adk.sessions.in_memory_session_service import InMemorySessionService
+    return InMemorySessionService()
+
+# FunctionTool introspects the wrapped function's signature, and building an
+# agent validates its whole config, so both are memoized for REPL re-probes.
+@functools.lru_cache(maxsize=None)
+def _tool_for(fn):
+    from google.adk.tools import FunctionTool
+    return FunctionTool(fn)
+
+@functools.lru_cache(maxsize=None)
+def _agent_for(name, instruction, model, tools):
+    from google.adk.agents import LlmAgent
+    return LlmAgent(name=name, instruction=instruction, model=model, tools=list(tools))
+
+async def probe_agent():
     # Test 1: Can we create an agent with the tool?
-    try:
-        tools = [FunctionTool(update_sprint_task_status)]
-        agent = LlmAgent(name="TestAgent", instruction="Test", model="gemini-1.5-pro-preview-0409", tools=tools)
-        print("Agent created.")
-    except Exception as e:
-        print(f"Agent creation failed: {e}")
-        return
+    tools = (_tool_for(update_sprint_task_status),)
+    agent = _agent_for("TestAgent", "Test", "gemini-1.5-pro-preview-0409", tools)
+    print("Agent created.")
+    return agent
 
+async def probe_runner(session_service, agent, session_id="Session1"):
     # Test 2: Can we run the tool?
     # We won't actually call the LLM to avoid cost/time, just check if Runner init works.
-    try:
-        await session_service.create_session("App", "User", "Session1")
-        runner = Runner(app_name="App", agent=agent, session_service=session_service)
-        print("Runner created.")
-    except Exception as e:
-        print(f"Runner creation failed: {e}")
+    from google.adk.runners import Runner
+    await session_service.create_session(app_name="App", user_id="User", session_id=session_id)
+    runner = Runner(app_name="App", agent=agent, session_service=session_service)
+    print("Runner created.")
+    return runner
 
+async def probe_direct():
     # Test 3: Can we call the async function directly?
-    try:
-        res = await update_sprint_task_status("doesntexist", "[x]")
-        print(f"Direct call result: {res}")
-    except Exception as e:
-        print(f"Direct call failed: {e}")
+    res = await update_sprint_task_status("doesntexist", "[x]")
+    print(f"Direct call result: {res}")
+    return res
+
+async def main(full=False):
+    print("Initializing...")
+    probes = {}
+
+    if full:
+        session_service = _new_session_service()
+        try:
+            agent = await asyncio.wait_for(probe_agent(), timeout=PROBE_TIMEOUT)
+        except Exception as e:
+            print(f"Agent creation failed: {e}")
+            return
+        probes["Runner creation"] = probe_runner(session_service, agent)
+
+    # Runner setup and the direct tool call are independent, so overlap them
+    probes["Direct call"] = probe_direct()
+    results = await asyncio.gather(
+        *(asyncio.wait_for(p, timeout=PROBE_TIMEOUT) for p in probes.values()),
+        return_exceptions=True
+    )
+    for name, result in zip(probes, results):
+        if isinstance(result, BaseException):
+            print(f"{name} failed: {result!r}")
+
+async def repl():
+    """
+    Stay resident and re-run probes on demand, so the ADK imports, the event
+    loop and the session service are paid for once per debugging session.
+    """
+    print("Initializing...")
+    session_service = None
+    session_ids = (f"Session{n}" for n in itertools.count(1))
+    agent = None
+    print("Commands: a = create agent (cached), r = (re)create runner, d = direct call, q = quit")
+
+    while True:
+        try:
+            cmd = (await asyncio.to_thread(input, "> ")).strip().lower()
+        except EOFError:
+            break
+
+        try:
+            if cmd == "a":
+                agent = await asyncio.wait_for(probe_agent(), timeout=PROBE_TIMEOUT)
+            elif cmd == "r":
+                if agent is None:
+                    agent = await asyncio.wait_for(probe_agent(), timeout=PROBE_TIMEOUT)
+                if session_service is None:
+                    session_service = _new_session_service()
+                await asyncio.wait_for(probe_runner(session_service, agent, next(session_ids)), timeout=PROBE_TIMEOUT)
+            elif cmd == "d":
+                await asyncio.wait_for(probe_direct(), timeout=PROBE_TIMEOUT)
+            elif cmd in ("q", "quit", "exit"):
+                break
+            elif cmd:
+                print(f"Unknown command: {cmd}")
+        except Exception as e:
+            print(f"Probe '{cmd}' failed: {e!r}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Debug ADK wiring for the Sprint Runner")
+    parser.add_argument(
+        "--repl",
+        action="store_true",
+        help="Keep the process resident and re-run probes interactively"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Also run the ADK agent/runner probes (default: direct tool call only)"
+    )
+    args = parser.parse_args()
+
+    # The probes are pure coroutine work (no subprocess I/O), so use the
+    # cheapest loop available and keep asyncio debug mode off even if
+    # PYTHONASYNCIODEBUG / -X dev is set in the shell.
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
+    asyncio.run(repl() if args.repl else main(full=args.full), debug=False)
@@ -1,14 +1,28 @@
 import argparse
 import asyncio
+import atexit
+import copy
+import functools
+import itertools
 import os
+import queue
 import re
 import sys
 import traceback
+import weakref
+from collections import Counter
 from google.adk.agents import LlmAgent
+from google.adk.models.registry import LLMRegistry
 from google.adk.runners import Runner
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.genai import types
-from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception
+from tenacity import retry, wait_exponential_jitter, stop_after_attempt, retry_if_exception, before_sleep_log
+
+# Optional: proactive request pacing (falls back to reactive retries only)
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
 
 # Import Config and Modules
 from sprint_config import SprintConfig
@@ -18,8 +32,7 @@ from sprint_tools import (
     qa_tools, 
     pm_tools,
     record_turn_usage, 
-    update_sprint_task_status, 
-    update_sprint_task_status, 
+    SprintStateWriter,
     update_sprint_header,
     search_memory,
     search_memory,
@@ -36,13 +49,39 @@ from sprint_memory import SprintMemoryBank
 from sprint_guardrails import AgentGuardrails
 from sprint_profile import ProfileManager
 from sprint_messaging import MessagingManager
-from sprint_utils import detect_latest_sprint_file, parse_sprint_tasks, get_all_sprint_tasks, analyze_sprint_status
-from sprint_metadata import parse_task_metadata
+from sprint_utils import (
+    detect_latest_sprint_file, parse_sprint_file_once, get_all_sprint_tasks, analyze_sprint_status,
+    strip_blocker_tag
+)
+from sprint_metadata import parse_task_metadata_all
 
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 # --- Prompt Sanitization ---
+# Precompiled once; sanitization runs on every prompt the runner loads.
+# Code fences are located with str.split rather than a lazy regex scan.
+_FENCE = "```"
+# Group 1: Opening braces
+# Group 2: Potential identifier start (alpha + alnum/dot/underscore/bracket)
+# Group 3: Closing braces
+_IDENT_RE = re.compile(r'(\{+)([a-zA-Z][a-zA-Z0-9_\.\[\]\"\'\-]*)(\}+)')
+
+def _poison_identifier(m):
+    """Inject zero-width space after the first character of an {identifier}"""
+    braces = m.group(1) # { or {{ or {{{
+    identifier = m.group(2) # the actual name
+    rest = m.group(3) # } or }} or }}}
+    if identifier and identifier[0].isalpha():
+        return f"{braces}{identifier[0]}\u200b{identifier[1:]}{rest}"
+    return m.group(0)
+
+def _poison_code_block(block):
+    """Poison anything that looks like {var} or {var.attr} or {var[key]} in a code block"""
+    if "{" not in block:
+        return block
+    return _IDENT_RE.sub(_poison_identifier, block)
+
 def sanitize_prompt_for_adk(prompt_text):
     """
     Sanitize prompt text to prevent ADK template variable substitution errors.
@@ -61,35 +100,70 @@ def sanitize_prompt_for_adk(prompt_text):
     if not prompt_text:
         return prompt_text
     
-    # Pattern to match code blocks (triple backticks)
-    code_block_pattern = r'```[\s\S]*?```'
-    
-    def poison_identifiers(match):
-        """Inject zero-width space into {identifier} patterns"""
-        content = match.group(0)
-        # Find anything that looks like {var} or {var.attr} or {var[key]}
-        # and inject \u200b after the first character of the potential identifier
-        def replacer(m):
-            braces = m.group(1) # { or {{ or {{{
-            identifier = m.group(2) # the actual name
-            rest = m.group(3) # } or }} or }}}
-            if identifier and identifier[0].isalpha():
-                return f"{braces}{identifier[0]}\u200b{identifier[1:]}{rest}"
-            return m.group(0)
-
-        # Regex to find {identifier} patterns
-        # Group 1: Opening braces
-        # Group 2: Potential identifier start (alpha + alnum/dot/underscore/bracket)
-        # Group 3: Closing braces
-        sanitized_content = re.sub(r'(\{+)([a-zA-Z][a-zA-Z0-9_\.\[\]\"\'\-]*)(\}+)', replacer, content)
-        return sanitized_content
-    
-    # Apply poisoning only to code blocks
-    sanitized = re.sub(code_block_pattern, poison_identifiers, prompt_text)
-    
-    return sanitized
+    # Apply poisoning only to code blocks: odd segments between fences.
+    # A trailing unclosed fence is left alone, as it isn't a code block.
+    segments = prompt_text.split(_FENCE)
+    closed = len(segments) - 1 if len(segments) % 2 == 0 else len(segments)
+    for i in range(1, closed, 2):
+        segments[i] = _poison_code_block(segments[i])
+    return _FENCE.join(segments)
+
+@functools.lru_cache(maxsize=32)
+def _load_sanitized_prompt(prompt_path):
+    """
+    Read and sanitize a prompt file once per process.
+    Prompt files are static while the runner is alive, so every task and
+    phase using the same prompt shares one disk read and one sanitization pass.
+    
+    Returns:
+        Sanitized prompt text, or None if the file does not exist
+    """
+    if not os.path.exists(prompt_path):
+        return None
+    with open(prompt_path, "r", encoding="utf-8") as f:
+        return sanitize_prompt_for_adk(f.read())
+
+@functools.lru_cache(maxsize=32)
+def _phase_instruction(framework_instruction, prompt_file, default):
+    """
+    Framework prompt joined with a phase prompt, built once per framework text.
+    The framework prompt is tens of KB, so re-joining it on every phase call
+    would allocate a fresh copy each cycle for an identical result.
+    """
+    prompt = _load_sanitized_prompt(os.path.join(SprintConfig.PROMPT_BASE_DIR, prompt_file))
+    return f"{framework_instruction}\n\n{prompt or default}"
+
+@functools.lru_cache(maxsize=8)
+def _retro_template_parts(framework_instruction):
+    """
+    Retro instruction pre-split at each {user_feedback} placeholder, so the
+    per-sprint work is a join with the feedback instead of a search/replace
+    over the whole framework + template text. None if the template is missing.
+    """
+    template = _load_sanitized_prompt(
+        os.path.join(SprintConfig.PROMPT_BASE_DIR, "agent_pm_retrospective.md")
+    )
+    if template is None:
+        return None
+    first, *rest = template.split("{user_feedback}")
+    return (f"{framework_instruction}\n\n{first}", *rest)
 
 # --- Logging Setup ---
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that skips the stock prepare()'s Formatter pass. %-style args
+    are merged into the message here, on the calling thread, since they may be
+    mutable objects (e.g. tool call args) that change before the listener runs.
+    What stays off the event loop is the Formatter work (asctime, level name,
+    exception text) and all handler I/O, which run on the listener thread.
+    """
+    def prepare(self, record):
+        if record.args:
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
 def setup_logging(project_root=None):
     """
     Set up logging with project-specific timestamped log files.
@@ -142,17 +216,42 @@ def setup_logging(project_root=None):
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Configure root logger
+    # Configure root logger. Callers only pay for a queue put; the file and
+    # console handlers run on the listener's background thread.
     logger = logging.getLogger("SprintRunner")
     logger.setLevel(logging.DEBUG)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    shutdown_logging()
+    
+    log_queue = queue.Queue(-1)
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    logger.queue_listener = listener
     
     # Log the log file location
     logger.info(f"Logging to: {log_file}")
     
     return logger
 
+def shutdown_logging():
+    """Flush and stop the background log listener started by setup_logging()."""
+    logger = logging.getLogger("SprintRunner")
+    listener = getattr(logger, "queue_listener", None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    for handler in [h for h in logger.handlers if isinstance(h, QueueHandler)]:
+        logger.removeHandler(handler)
+    logger.queue_listener = None
+
+atexit.register(shutdown_logging)
+
+# Session ids only need to be unique within the process-wide session service,
+# so a counter does the job without a getrandom() syscall per session
+_next_session_seq = itertools.count(1).__next__
+
 # Logger will be initialized with project context in main()
 logger = None
 
@@ -160,33 +259,132 @@ def log(msg):
     # Log to file and console via logger
     logger.info(msg)
 
+_RATE_LIMIT_RE = re.compile(r"429|ResourceExhausted|Quota exceeded")
+# Programming/config errors that a retry can never fix
+_NON_RETRYABLE = (ValueError, KeyError, TypeError, FileNotFoundError)
+
 def retry_predicate(exception):
     """
     Retry if the exception is a 429 Resource Exhausted or related rate limit error.
+    Typed signals (google-api-core's class, google-genai's status code) are
+    checked before falling back to scanning the message.
     """
-    e_str = str(exception)
-    if "429" in e_str or "ResourceExhausted" in e_str or "Quota exceeded" in e_str:
-        log(f"    [Retry Trigger] Detected Rate Limit (429): {e_str[:100]}...")
-        return True
-    return False
+    # Cancellation (and other BaseExceptions) must propagate, never back off
+    if not isinstance(exception, Exception) or isinstance(exception, _NON_RETRYABLE):
+        return False
+    if type(exception).__name__ == "ResourceExhausted" or getattr(exception, "code", None) == 429:
+        matched = True
+    else:
+        msg = exception.args[0] if exception.args else ""
+        matched = _RATE_LIMIT_RE.search(msg if isinstance(msg, str) else str(msg)) is not None
+    if matched:
+        log(f"    [Retry Trigger] Detected Rate Limit (429): {str(exception)[:100]}...")
+    return matched
+
+# Longest sleep the fallback backoff will pick on its own
+_MAX_RETRY_WAIT = 120
+
+# Safety ceiling on a server-suggested delay; retrying before the server's
+# window opens just burns an attempt on another 429
+_MAX_SERVER_RETRY_WAIT = 600
+
+# Fallback schedule: between 10s and 120s, plus up to 5s of random jitter so
+# parallel workers that hit the same 429 don't all retry at the same instant
+_backoff_wait = wait_exponential_jitter(initial=10, max=_MAX_RETRY_WAIT, jitter=5)
+
+def _clamp_retry_delay(seconds):
+    return min(max(0.0, seconds), _MAX_SERVER_RETRY_WAIT)
+
+def get_retry_after_seconds(exception):
+    """
+    Extract the server-suggested retry delay (in seconds) from a rate limit error.
+    
+    Understands google-api-core's `retry_delay`, the RetryInfo `retryDelay` detail
+    carried by google-genai's APIError, and a plain HTTP `Retry-After` header.
+    
+    Returns:
+        float seconds, capped at _MAX_SERVER_RETRY_WAIT, or None if the server gave no hint
+    """
+    delay = getattr(exception, "retry_delay", None)
+    if delay is not None:
+        return _clamp_retry_delay(delay.total_seconds() if hasattr(delay, "total_seconds") else float(delay))
+    
+    details = getattr(exception, "details", None)
+    if isinstance(details, dict):
+        for detail in (details.get("error") or {}).get("details") or []:
+            if isinstance(detail, dict) and detail.get("retryDelay"):
+                try:
+                    return _clamp_retry_delay(float(str(detail["retryDelay"]).rstrip("s")))
+                except ValueError:
+                    pass
+    
+    headers = getattr(getattr(exception, "response", None), "headers", None)
+    if headers:
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return _clamp_retry_delay(float(retry_after))
+            except ValueError:
+                pass
+    
+    return None
+
+def wait_for_rate_limit(retry_state):
+    """Sleep exactly as long as the server asked for, else fall back to jittered backoff."""
+    exception = retry_state.outcome.exception() if retry_state.outcome else None
+    delay = get_retry_after_seconds(exception) if exception else None
+    if delay is not None:
+        return delay
+    return _backoff_wait(retry_state)
 
-retry_decorator = retry(
-    wait=wait_exponential(multiplier=10, min=10, max=120), # Wait between 10s and 120s
+_retry_rate_limited = retry(
+    wait=wait_for_rate_limit,
     stop=stop_after_attempt(10), # Increase retries to 10 for deep backoff
     retry=retry_if_exception(retry_predicate),
+    before_sleep=before_sleep_log(logging.getLogger("SprintRunner"), logging.WARNING),
+    sleep=asyncio.sleep,
     reraise=True
 )
 
-def validate_sprint_state(sprint_file):
+def retry_decorator(fn):
+    """
+    Retry a coroutine function on rate limits, backing off with asyncio.sleep.
+    Only coroutine functions are accepted: on a sync function the same
+    decorator would back off with a blocking sleep and stall the event loop.
+    """
+    if not asyncio.iscoroutinefunction(fn):
+        raise TypeError(f"retry_decorator requires a coroutine function, got {fn!r}")
+    return _retry_rate_limited(fn)
+
+async def safe_gather(*aws):
+    """
+    Like asyncio.gather(), but if one awaitable fails the others are cancelled
+    (and awaited) before the exception propagates, instead of left running.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+def validate_sprint_state(sprint_file, status=None):
     """
     Validates if a sprint is ready to run or needs planning.
     
+    Args:
+        status: analyze_sprint_status() result for sprint_file, if the caller
+                already has one; otherwise the file is parsed here
+    
     Returns:
         'ready': Sprint has tasks and can be executed
         'needs_planning': Sprint exists but has no tasks
         'completed': All tasks are done
     """
-    status = analyze_sprint_status(sprint_file)
+    if status is None:
+        status = analyze_sprint_status(sprint_file)
     
     # Check if sprint has any tasks defined
     if status['total'] == 0:
@@ -200,6 +398,41 @@ def validate_sprint_state(sprint_file):
     
     return 'ready'
 
+# Event loop -> {model name: model instance}; entries go away with their loop
+_shared_llms = weakref.WeakKeyDictionary()
+
+def _shared_llm(model_name):
+    """
+    One model instance per model name and event loop. ADK builds a fresh genai
+    Client (and so a fresh HTTP connection pool) for every agent given a model
+    *string*; sharing the instance lets all agents on a model reuse one pooled
+    client. The pinned ADK caches that client on the instance, bound to the loop
+    that first used it, so a later asyncio.run() must not inherit it.
+    """
+    models = _shared_llms.setdefault(asyncio.get_running_loop(), {})
+    if model_name not in models:
+        models[model_name] = LLMRegistry.new_llm(model_name)
+    return models[model_name]
+
+# Event loop -> {model name: limiter}; like _shared_llms, since waiters are loop-bound
+_llm_limiters = weakref.WeakKeyDictionary()
+
+def _llm_limiter(model_name):
+    """
+    One leaky bucket per model and event loop, shared by every agent on it, so
+    requests are paced to the model's RPM quota up front instead of colliding
+    into 429s.
+    """
+    limiters = _llm_limiters.setdefault(asyncio.get_running_loop(), {})
+    if model_name not in limiters:
+        limiters[model_name] = AsyncLimiter(max_rate=SprintConfig.get_rpm_limit(model_name), time_period=60)
+    return limiters[model_name]
+
+async def _pace_model_call(callback_context, llm_request):
+    """before_model_callback: wait for the model's RPM budget before every request."""
+    await _llm_limiter(llm_request.model or SprintConfig.MODEL_NAME).acquire()
+    return None
+
 def default_agent_factory(name, instruction, tools, model=None, agent_role=None):
     """
     Create an LLM agent with optimal model selection.
@@ -217,9 +450,60 @@ def default_agent_factory(name, instruction, tools, model=None, agent_role=None)
         model = SprintConfig.get_model_for_agent(identifier)
     
     logger.info(f"Creating agent '{name}' (role: {agent_role or 'unknown'}) with model: {model}")
-    return LlmAgent(name=name, instruction=instruction, tools=tools, model=model)
+    if isinstance(model, str):
+        model = _shared_llm(model)
+    return LlmAgent(
+        name=name, instruction=instruction, tools=tools, model=model,
+        before_model_callback=_pace_model_call if AsyncLimiter else None
+    )
+
+# Set on first use by run_parallel_execution
+_project_context_cache = None
+
+# Entries rewritten by the runner itself; including them would invalidate the
+# project context cache on every run
+_CONTEXT_FINGERPRINT_IGNORE = {".agent", "project_tracking", "logs", "__pycache__"}
+
+def load_project_context(project_root):
+    """
+    Return discover_project_context() output for project_root, reusing the copy
+    cached under .agent/cache/ while the project's top-level entries are unchanged.
+    """
+    from sprint_tools import discover_project_context
+    import hashlib
+    import glob
+    
+    try:
+        fingerprint = hashlib.sha1("".join(
+            f"{name}:{os.path.getmtime(os.path.join(project_root, name))}"
+            for name in sorted(os.listdir(project_root))
+            if name not in _CONTEXT_FINGERPRINT_IGNORE
+        ).encode()).hexdigest()[:12]
+    except OSError:
+        return discover_project_context(project_root)
+    
+    cache_dir = os.path.join(project_root, ".agent", "cache")
+    cache_file = os.path.join(cache_dir, f"project_context_{fingerprint}.json")
+    if os.path.exists(cache_file):
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return f.read()
+    
+    context_json = discover_project_context(project_root)
+    if '"error"' not in context_json:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            for stale in glob.glob(os.path.join(cache_dir, "project_context_*.json")):
+                os.remove(stale)
+            with open(cache_file, "w", encoding="utf-8") as f:
+                f.write(context_json)
+        except OSError as e:
+            logging.getLogger("SprintRunner").warning(f"[Context Discovery] Could not write cache: {e}")
+    return context_json
 
 # --- Phase 1: Parallel Execution ---
+# ADK agent names must be identifiers; role names come from the sprint file
+_AGENT_NAME_RE = re.compile(r'[^a-zA-Z0-9_]')
+
 async def run_parallel_execution(
     session_service, 
     framework_instruction, 
@@ -228,13 +512,23 @@ async def run_parallel_execution(
     memory_bank=None, 
     guardrails=None, 
     profile_manager=None,
-    messaging_manager=None
+    messaging_manager=None,
+    parsed=None
 ):
+    """
+    Execute every pending task of the sprint on a bounded pool of workers.
+    
+    Args:
+        parsed: parse_sprint_file_once() result for sprint_file, if the caller
+                parsed it after the last task status change; else re-parsed here
+    """
+    global _project_context_cache
     log("\n[Phase 1] Parallel Execution: Analyzing sprint status...")
-    await update_sprint_header("In Progress", SprintConfig.get_sprint_dir())
+    sprint_dir = SprintConfig.get_sprint_dir()
+    await update_sprint_header("In Progress", sprint_dir)
     
-    # Analyze sprint status before execution
-    status_summary = analyze_sprint_status(sprint_file)
+    # Analyze sprint status and collect pending tasks from a single parse
+    status_summary, tasks_to_execute = parsed or parse_sprint_file_once(sprint_file)
     log(f"    Sprint Status Summary:")
     log(f"      Total Tasks: {status_summary['total']}")
     log(f"      Completed: {status_summary.get('done', 0)}")
@@ -253,493 +547,546 @@ async def run_parallel_execution(
             log(f"      - @{in_prog_task['role']}: {in_prog_task['desc']}")
     
     log("\n    Checking for tasks to execute...")
-    tasks_to_execute = parse_sprint_tasks(sprint_file)
     if not tasks_to_execute:
         log("    No pending tasks found.")
-        return 0
+        return []
 
     # Count tasks by status
-    status_counts = {"todo": 0, "in_progress": 0, "blocked": 0}
-    for task in tasks_to_execute:
-        status_counts[task["status"]] += 1
+    status_counts = Counter(task.status for task in tasks_to_execute)
     
     log(f"    Found {len(tasks_to_execute)} tasks to execute: {status_counts['todo']} Todo, {status_counts['in_progress']} In-Progress, {status_counts['blocked']} Blocked")
     
     concurrency_limit = SprintConfig.CONCURRENCY_LIMIT
     role_map = SprintConfig.get_role_map()
     
-    # Track retry attempts per task description to prevent infinite blocked loops
+    # Read every role prompt up front, before the workers start, so no task
+    # does prompt file I/O. The first batch's reads (later ones hit the
+    # prompt cache) happen in a thread rather than on the event loop.
+    def load_prompt(prompt_file):
+        return _load_sanitized_prompt(os.path.join(SprintConfig.PROMPT_BASE_DIR, prompt_file))
+    
+    def load_role_prompts():
+        return (
+            {role_name: load_prompt(prompt_file) for role_name, prompt_file in role_map.items()},
+            load_prompt("agent_orchestrator.md"),
+            load_prompt("agent_reviewer.md") or "You are the Task Reviewer. Validate the task."
+        )
+    role_prompts, fallback_prompt, reviewer_prompt = await asyncio.to_thread(load_role_prompts)
+    
+    # Track retry attempts per task (keyed by its index in this batch) to prevent infinite blocked loops
     task_retry_tracker = {}
     MAX_BLOCKED_RETRIES = 2
     
-    # Create a Queue and populate it
-    queue = asyncio.Queue()
-    for idx, task in enumerate(tasks_to_execute):
-        await queue.put((idx, task))
-        
-    async def worker(worker_id):
-        while True:
+    # Framework + role prompt + project context is identical for every task of
+    # a role, so each role gets one shared agent carrying it as the instruction;
+    # the per-task parts travel in the user message instead. A Runner only
+    # binds an agent to the session service, so it is shared per role too
+    role_agents = {}
+    role_runners = {}
+    
+    # Recall memories for every queued task with one batched vector search,
+    # instead of one search per task on each worker's critical path
+    task_memories = [[] for _ in tasks_to_execute]
+    if memory_bank and memory_bank.enable_memory:
+        try:
+            task_memories = memory_bank.recall_batch([t.desc for t in tasks_to_execute], top_k=3)
+        except Exception as mem_err:
+            log(f"    [Memory Recall] Failed: {mem_err}")
+    
+    # Discover the project context (cached for the process) before any worker
+    # starts, so every worker shares one discovery instead of racing into it
+    project_root = SprintConfig.PROJECT_ROOT or os.getcwd()
+    if _project_context_cache is None:
+        try:
+            # Walks the project tree; run it off the event loop
+            _project_context_cache = await asyncio.to_thread(
+                load_project_context, project_root
+            )
+            log(f"    [Context Discovery] Discovered project context: {_project_context_cache[:200]}...")
+        except Exception as e:
+            _project_context_cache = '{"error": "Context discovery failed"}'
+            log(f"    [Context Discovery] Failed: {e}")
+    
+    project_context_instruction = (
+        f"\n\n=== PROJECT CONTEXT ===\n"
+        f"Working Directory: {project_root}\n"
+        f"Technology Stack Analysis:\n{_project_context_cache}\n"
+        f"\n**CRITICAL**: You MUST use the technologies listed above. "
+        f"Do NOT introduce new languages or frameworks.\n"
+        f"========================\n"
+    )
+    
+    # Status updates from all workers are coalesced into batched rewrites
+    state_writer = SprintStateWriter(sprint_dir).start()
+    
+    async def run_one(task_index, task_info):
+        messaging_token = None
+        try:
+            role_raw = task_info.role
+            role = role_raw.lower()
+            desc = task_info.desc
+            status = task_info.status
+            blocker_reason = task_info.blocker_reason
+            task_meta = parse_task_metadata_all(desc)
+                
+                
+            # --- Inject Messaging Context ---
+            if messaging_manager:
+                # Set contextvar for this task
+                messaging_token = current_messaging_context.set({
+                    "manager": messaging_manager,
+                    "role": role_raw,
+                    "seen_ids": set()
+                })
+                
+            if guardrails:
+                # --- Guardrails Input Validation ---
+                is_valid, violations = guardrails.validate_input(desc)
+                if not is_valid:
+                    log(f"\n    [Task {task_index+1}] BLOCKED by guardrails:")
+                    for v in violations:
+                        log(f"      - {v.reason}")
+                        
+                    await state_writer.submit(desc, "[!]", blocker_reason=f"Guardrail violation: {violations[0].reason}")
+                    return
+
+                # --- Circuit Breaker Check ---
+                allowed, circuit_reason = guardrails.check_circuit(desc)
+                if not allowed:
+                    log(f"\n    [Task {task_index+1}] Circuit breaker OPEN: {circuit_reason}")
+                    await state_writer.submit(desc, "[!]", blocker_reason=circuit_reason)
+                    return
+                
+            # Check retry limit for blocked tasks
+            if status == "blocked":
+                retry_count = task_retry_tracker.get(task_index, 0)
+                if retry_count >= MAX_BLOCKED_RETRIES:
+                    log(f"\n    [Task {task_index+1}] SKIPPING - exceeded retry limit ({retry_count} attempts): @{role_raw}: {desc}")
+                    log(f"    This task requires manual intervention. Check logs for previous failure reasons.")
+                    return
+                else:
+                    log(f"\n    [Task {task_index+1}] Retrying blocked task (attempt {retry_count + 1}/{MAX_BLOCKED_RETRIES}): @{role_raw}: {desc}")
+                
+            status_label = status.upper().replace('_', '-')
+            log(f"\n    [Task {task_index+1}] Starting @{role_raw} [{status_label}]: {desc}")
+                
+            # DIRECT UPDATE: Mark in-progress
             try:
-                # Get a "unit of work" from the queue.
-                task_index, task_info = await queue.get()
+                await state_writer.submit(desc, "[/]")
+            except Exception as e:
+                log(f"    [Update Error] Failed to mark in-progress: {e}")
+
+            instruction = role_prompts[role_raw] if role_raw in role_map else fallback_prompt
+            if instruction is None:
+                instruction = f"Act as {role}."
+
+
+            # --- Reviewer Step (Only for tasks with [REVIEW] tag) ---
+            # Skip review for tasks without [REVIEW] tag to avoid analysis paralysis
+            has_review_tag = "[REVIEW]" in desc.upper()
                 
-                try:
-                    role_raw = task_info["role"]
-                    role = role_raw.lower()
-                    desc = task_info["desc"]
-                    status = task_info["status"]
-                    blocker_reason = task_info.get("blocker_reason")
-                    
+            if status == "todo" and has_review_tag:
+                log(f"\n    [Task {task_index+1}] Starting Reviewer for: @{role_raw}: {desc}")
                     
-                    # --- Inject Messaging Context ---
-                    messaging_token = None
-                    if messaging_manager:
-                        # Set contextvar for this task
-                        messaging_token = current_messaging_context.set({
-                            "manager": messaging_manager,
-                            "role": role_raw,
-                            "seen_ids": set()
-                        })
+                reviewer_agent = agent_factory(
+                    name=f"Reviewer_{task_index}",
+                    instruction="", # Will be loaded from file in factory or below
+                    tools=reviewer_tools,
+                    agent_role="Reviewer"
+                )
                     
-                    if guardrails:
-                        # --- Guardrails Input Validation ---
-                        is_valid, violations = guardrails.validate_input(desc)
-                        if not is_valid:
-                            log(f"\n    [Worker {worker_id} -> Task {task_index+1}] BLOCKED by guardrails:")
-                            for v in violations:
-                                log(f"      - {v.reason}")
-                            
-                            await update_sprint_task_status(
-                                desc, "[!]",
-                                blocker_reason=f"Guardrail violation: {violations[0].reason}",
-                                sprint_dir=SprintConfig.get_sprint_dir()
-                            )
-                            queue.task_done()
-                            continue
-
-                        # --- Circuit Breaker Check ---
-                        allowed, circuit_reason = guardrails.check_circuit(desc)
-                        if not allowed:
-                            log(f"\n    [Worker {worker_id} -> Task {task_index+1}] Circuit breaker OPEN: {circuit_reason}")
-                            await update_sprint_task_status(
-                                desc, "[!]",
-                                blocker_reason=circuit_reason,
-                                sprint_dir=SprintConfig.get_sprint_dir()
-                            )
-                            queue.task_done()
-                            continue
+                # Context for Reviewer
+                rev_full_instruction = (
+                    f"{framework_instruction}\n\n{reviewer_prompt}\n"
+                    f"\n=== TARGET TASK ===\n"
+                    f"Role: {role_raw}\n"
+                    f"Description: {desc}\n"
+                    f"===================\n"
+                    f"{project_context_instruction}" 
+                )
                     
-                    # Check retry limit for blocked tasks
-                    if status == "blocked":
-                        retry_count = task_retry_tracker.get(desc, 0)
-                        if retry_count >= MAX_BLOCKED_RETRIES:
-                            log(f"\n    [Worker {worker_id} -> Task {task_index+1}] SKIPPING - exceeded retry limit ({retry_count} attempts): @{role_raw}: {desc}")
-                            log(f"    This task requires manual intervention. Check logs for previous failure reasons.")
-                            queue.task_done()
-                            continue
-                        else:
-                            log(f"\n    [Worker {worker_id} -> Task {task_index+1}] Retrying blocked task (attempt {retry_count + 1}/{MAX_BLOCKED_RETRIES}): @{role_raw}: {desc}")
+                # Update agent instruction
+                reviewer_agent._instruction = rev_full_instruction
                     
-                    status_label = status.upper().replace('_', '-')
-                    log(f"\n    [Worker {worker_id} -> Task {task_index+1}] Starting @{role_raw} [{status_label}]: {desc}")
+                # Run Reviewer
+                rev_pid = f"reviewer_{task_index}_{_next_session_seq()}"
+                await session_service.create_session(app_name="SprintRunner", user_id="user", session_id=rev_pid)
+                rev_runner = Runner(app_name="SprintRunner", agent=reviewer_agent, session_service=session_service)
                     
-                    # DIRECT UPDATE: Mark in-progress
-                    try:
-                        await update_sprint_task_status(desc, "[/]", SprintConfig.get_sprint_dir())
-                    except Exception as e:
-                        log(f"    [Update Error] Failed to mark in-progress: {e}")
-
-                    prompt_file = role_map.get(role_raw, "agent_orchestrator.md")
-                    prompt_path = os.path.join(SprintConfig.PROMPT_BASE_DIR, prompt_file)
-                    if os.path.exists(prompt_path):
-                        with open(prompt_path, "r", encoding="utf-8") as f:
-                            instruction = sanitize_prompt_for_adk(f.read())
-                    else:
-                        instruction = f"Act as {role}."
-
-                    agent_name = f"{re.sub(r'[^a-zA-Z0-9_]', '', role)}_{task_index}"
+                review_decision = "APPROVE" # Default
+                review_critique = ""
                     
+                try:
+                    # Limited turns for reviewer
+                    async for rev_event in rev_runner.run_async(
+                        user_id="user", 
+                        session_id=rev_pid, 
+                        new_message=types.Content(parts=[types.Part(text=f"Review this task: {desc}")])
+                    ):
+                        if rev_event.content and rev_event.content.parts:
+                            for part in rev_event.content.parts:
+                                if part.text:
+                                    text = part.text
+                                    logger.info("[Reviewer] %s", text)
+                                        
+                                    # Parse Decision
+                                    if "DECISION: BLOCK" in text:
+                                        review_decision = "BLOCK"
+                                    elif "DECISION: WARN" in text:
+                                        review_decision = "WARN"
+                                        
+                                    if "REASON:" in text:
+                                        pass # Could parse reason
+                                        
+                                    review_critique += text + "\n"
+                                        
+                except Exception as rev_e:
+                    log(f"    [Reviewer] Failed: {rev_e}. Proceeding with CAUTION.")
+                    review_critique += f"\n[System Error] Reviewer crashed: {rev_e}"
+                finally:
+                    await _release_session(session_service, rev_pid)
+                        
+                log(f"    [Reviewer] Decision: {review_decision}")
                     
-                    # Discover and inject project context (cached per execution)
-                    if not hasattr(run_parallel_execution, '_project_context_cache'):
-                        try:
-                            from sprint_tools import discover_project_context
-                            project_root = SprintConfig.PROJECT_ROOT or os.getcwd()
-                            context_json = discover_project_context(project_root)
-                            run_parallel_execution._project_context_cache = context_json
-                            log(f"    [Context Discovery] Discovered project context: {context_json[:200]}...")
-                        except Exception as e:
-                            run_parallel_execution._project_context_cache = '{"error": "Context discovery failed"}'
-                            log(f"    [Context Discovery] Failed: {e}")
+                if review_decision == "BLOCK":
+                    log(f"    [Task {task_index+1}] BLOCKED by Reviewer.")
+                    await state_writer.submit(desc, "[!]", blocker_reason=f"Reviewer Block: See logs/context. {review_critique[:100]}...")
+                    return
                     
-                    project_context_instruction = (
-                        f"\n\n=== PROJECT CONTEXT ===\n"
-                        f"Working Directory: {SprintConfig.PROJECT_ROOT or os.getcwd()}\n"
-                        f"Technology Stack Analysis:\n{run_parallel_execution._project_context_cache}\n"
-                        f"\n**CRITICAL**: You MUST use the technologies listed above. "
-                        f"Do NOT introduce new languages or frameworks.\n"
-                        f"========================\n"
-                    )
-
-                    # --- Reviewer Step (Only for tasks with [REVIEW] tag) ---
-                    # Skip review for tasks without [REVIEW] tag to avoid analysis paralysis
-                    has_review_tag = "[REVIEW]" in desc.upper()
+                if review_decision == "WARN":
+                     # Append critique to the task description or just context for the next agent
+                     # We'll inject it into the main agent's instruction prompt
+                     task_info.reviewer_note = f"\n\n=== ⚠️  REVIEWER WARNING ===\n{review_critique}\n==========================\n"
+                
+            # --- Profiling: Load and Inject Profile ---
+            profile_context = ""
+            if profile_manager:
+                 profile = profile_manager.get_profile(name=role_raw, role=role_raw)
+                 profile_context = f"\n\n=== AGENT PROFILE ===\n"
+                 profile_context += f"Identity: {profile.name} (Level {profile.level} {profile.role})\n"
+                 profile_context += f"XP: {profile.total_xp} | Success Rate: {profile.stats.get('success_rate', 0)}%\n"
+                 if profile.skills:
+                     profile_context += f"Skills: {', '.join(profile.skills)}\n"
+
+            # --- Memory Recall ---
+            memory_context = ""
+            relevant_memories = task_memories[task_index]
+            if relevant_memories:
+                log(f"    [Task {task_index+1}] Found {len(relevant_memories)} relevant memories")
+                memory_context = "\n\n=== RELEVANT PAST EXPERIENCES (MEMORY BANK) ===\n"
+                memory_context += "Use these insights to guide your implementation and avoid past errors:\n"
+                for i, mem in enumerate(relevant_memories, 1):
+                    relevance = 1 - mem.get('distance', 1.0)
+                    mem_type = mem.get('metadata', {}).get('memory_type', 'unknown')
+                    memory_context += f"{i}. [{relevance:.0%} relevant] ({mem_type}) {mem['content']}\n"
+                memory_context += "===============================================\n"
+                
+            # --- Messaging Injection ---
+            messaging_context = ""
+            if messaging_manager:
+                pending_messages = messaging_manager.get_messages(recipient=role_raw)
+                # Filter for unread or relevant context if needed, for now we show all 'pending' 
+                # In a real system we might track 'read' state per agent-task session.
+                # For now, we show strictly all messages for them.
+                if pending_messages:
+                    log(f"    [Task {task_index+1}] Injecting {len(pending_messages)} pending messages for @{role_raw}")
+                    messaging_context = "\n\n=== ✉️ PENDING MESSAGES ===\n"
+                    messaging_context += "You have unread messages. Review and acknowledge them immediately:\n"
+                    for msg in pending_messages:
+                        msg_type = msg.get('message_type', 'info').upper()
+                        is_broadcast = " (BROADCAST)" if msg.get('recipient') == 'all' else ""
+                        messaging_context += f"- [{msg['timestamp']}] FROM @{msg['sender']} [{msg_type}]{is_broadcast}: {msg['content']}\n"
+                    messaging_context += "===========================\n"
+
+            # Profile stays per-task: XP and success rate change as tasks complete
+            task_message = f"{profile_context}\n{memory_context}\n{messaging_context}\n\nExecute this task: {desc}"
+                
+            # Add status-specific instructions
+            if status == "in_progress":
+                resume_instruction = (
+                    "\n\n=== RESUME NOTICE ===\n"
+                    "This task is marked as IN_PROGRESS from a previous session.\n"
+                    "Search for existing files, code, or partial work in the workspace before starting.\n"
+                    "Resume where it left off if possible. Review any existing implementation.\n"
+                    "==================="
+                )
+                task_message += resume_instruction
+                log(f"    [Task {task_index+1}] Adding RESUME instruction")
+                
+            elif status == "blocked":
+                unblock_instruction = (
+                    "\n\n=== UNBLOCK NOTICE ===\n"
+                    "This task was previously BLOCKED.\n"
+                )
+                if blocker_reason:
+                    unblock_instruction += f"Previous blocker: {blocker_reason}\n"
+                unblock_instruction += (
+                    "Investigate the root cause, check logs, verify dependencies, and attempt to resolve the blocker.\n"
+                    "If still blocked after investigation, document the reason clearly in your response.\n"
+                    "======================"
+                )
+                task_message += unblock_instruction
+                
+            # Inject Reviewer Notes if any
+            if task_info.reviewer_note:
+                task_message += task_info.reviewer_note
+                log(f"    [Task {task_index+1}] Injected Reviewer Warnings")
+                log(f"    [Task {task_index+1}] Adding UNBLOCK instruction" + (f" (Reason: {blocker_reason})" if blocker_reason else ""))
+                
+            agent = role_agents.get(role_raw)
+            if agent is None:
+                agent = agent_factory(
+                    name=f"{_AGENT_NAME_RE.sub('', role)}_shared",
+                    instruction=f"{framework_instruction}\n\n{instruction}\n{project_context_instruction}",
+                    tools=worker_tools,
+                    agent_role=role  # Pass role for optimal model selection
+                )
+                role_agents[role_raw] = agent
+                role_runners[role_raw] = Runner(
+                    app_name="SprintRunner", 
+                    agent=agent, 
+                    session_service=session_service
+                )
+            runner = role_runners[role_raw]
+
+            worker_pid = f"worker_{task_index}_{_next_session_seq()}"
+            await session_service.create_session(
+                app_name="SprintRunner", 
+                user_id="user", 
+                session_id=worker_pid
+            )
+
+            # Built once, so retries resend the same message object
+            task_content = types.Content(parts=[types.Part(text=task_message)])
+
+            @retry_decorator
+            async def run_agent():
+                turn_count = 0
+                # Initialize budget from metadata if available, else default
+                initial_budget = task_meta.get('TURNS_ESTIMATED', 40)
+                soft_limit = max(40, initial_budget)
+                hard_limit = soft_limit * 2  # Progressive limit: 2x safety buffer
+                log(f"    [Agent {role_raw}] Starting with soft limit: {soft_limit}, hard limit: {hard_limit}")
                     
-                    if status == "todo" and has_review_tag:
-                        log(f"\n    [Worker {worker_id} -> Task {task_index+1}] Starting Reviewer for: @{role_raw}: {desc}")
-                        
-                        reviewer_agent = agent_factory(
-                            name=f"Reviewer_{task_index}",
-                            instruction="", # Will be loaded from file in factory or below
-                            tools=reviewer_tools,
-                            agent_role="Reviewer"
-                        )
+                # Bound once: this runs for every part of every event
+                info = logger.info
+                async for event in runner.run_async(
+                    user_id="user", 
+                    session_id=worker_pid, 
+                    new_message=task_content
+                ):
+                    turn_count += 1
                         
-                        # Load Reviewer Prompt
-                        rev_prompt_path = os.path.join(SprintConfig.PROMPT_BASE_DIR, "agent_reviewer.md")
-                        if os.path.exists(rev_prompt_path):
-                             with open(rev_prompt_path, "r", encoding="utf-8") as f:
-                                reviewer_instruction = sanitize_prompt_for_adk(f.read())
-                        else:
-                            reviewer_instruction = "You are the Task Reviewer. Validate the task."
-                            
-                        # Context for Reviewer
-                        rev_full_instruction = (
-                            f"{framework_instruction}\n\n{reviewer_instruction}\n"
-                            f"\n=== TARGET TASK ===\n"
-                            f"Role: {role_raw}\n"
-                            f"Description: {desc}\n"
-                            f"===================\n"
-                            f"{project_context_instruction}" 
-                        )
-                        
-                        # Update agent instruction
-                        reviewer_agent._instruction = rev_full_instruction
-                        
-                        # Run Reviewer
-                        rev_pid = f"reviewer_{task_index}_{os.urandom(4).hex()}"
-                        await session_service.create_session(app_name="SprintRunner", user_id="user", session_id=rev_pid)
-                        rev_runner = Runner(app_name="SprintRunner", agent=reviewer_agent, session_service=session_service)
-                        
-                        review_decision = "APPROVE" # Default
-                        review_critique = ""
-                        
-                        try:
-                            # Limited turns for reviewer
-                            async for rev_event in rev_runner.run_async(
-                                user_id="user", 
-                                session_id=rev_pid, 
-                                new_message=types.Content(parts=[types.Part(text=f"Review this task: {desc}")])
-                            ):
-                                if rev_event.content and rev_event.content.parts:
-                                    for part in rev_event.content.parts:
-                                        if part.text:
-                                            text = part.text
-                                            logger.info(f"[Reviewer] {text}")
+                    # Check for budget updates from tool calls
+                    parts = event.content.parts if event.content else None
+                    if parts:
+                        for part in parts:
+                            text, fc = part.text, getattr(part, 'function_call', None)
+                            if text:
+                                info("[Agent %s] Thought: %s", role_raw, text)
+                            if fc:
+                                info("[Agent %s] Call: %s(%s)", role_raw, fc.name, fc.args)
+                                    
+                                # Dynamic Budget Update
+                                if fc.name == "request_turn_budget":
+                                    try:
+                                        # args is a dict or struct, need to parse
+                                        args = fc.args
+                                        if isinstance(args, dict):
+                                            est = args.get('estimated_turns', 20)
+                                        else:
+                                            # Handle proto Struct conversion if needed
+                                            est = args['estimated_turns']
                                             
-                                            # Parse Decision
-                                            if "DECISION: BLOCK" in text:
-                                                review_decision = "BLOCK"
-                                            elif "DECISION: WARN" in text:
-                                                review_decision = "WARN"
-                                            
-                                            if "REASON:" in text:
-                                                pass # Could parse reason
-                                            
-                                            review_critique += text + "\n"
-                                            
-                        except Exception as rev_e:
-                            log(f"    [Reviewer] Failed: {rev_e}. Proceeding with CAUTION.")
-                            review_critique += f"\n[System Error] Reviewer crashed: {rev_e}"
-                            
-                        log(f"    [Reviewer] Decision: {review_decision}")
-                        
-                        if review_decision == "BLOCK":
-                            log(f"    [Worker {worker_id}] Task BLOCKED by Reviewer.")
-                            await update_sprint_task_status(
-                                desc, "[!]", 
-                                blocker_reason=f"Reviewer Block: See logs/context. {review_critique[:100]}...",
-                                sprint_dir=SprintConfig.get_sprint_dir()
-                            )
-                            queue.task_done()
-                            continue
+                                        # Progressive limits: soft = estimate, hard = 2x
+                                        soft_limit = max(20, int(est))
+                                        hard_limit = soft_limit * 2
+                                        log(f"    [Agent {role_raw}] Budget UPDATED - Soft: {soft_limit}, Hard: {hard_limit}")
+                                    except Exception as ex:
+                                        logger.error(f"Failed to parse turn budget update: {ex}")
+
+                    # Progressive limit enforcement
+                    if turn_count > soft_limit and turn_count <= hard_limit:
+                        overage = turn_count - soft_limit
+                        remaining = hard_limit - turn_count
+                        logger.warning(f"[Agent {role_raw}] ⚠️  WARNING: Exceeded estimate by {overage} turns, {remaining} turns until hard limit")
                         
-                        if review_decision == "WARN":
-                             # Append critique to the task description or just context for the next agent
-                             # We'll inject it into the main agent's instruction prompt
-                             task_info["reviewer_note"] = f"\n\n=== ⚠️  REVIEWER WARNING ===\n{review_critique}\n==========================\n"
+                    if turn_count > hard_limit:
+                        logger.error(f"[Agent {role_raw}] ❌ EXCEEDED HARD LIMIT ({hard_limit}). Killing.")
+                        raise RuntimeError(f"Task exceeded hard limit ({hard_limit})")
+
+                return turn_count
+
+            actual_turns = 0
+            try:
+                actual_turns = await run_agent()
+                log(f"    [Task {task_index+1}] Completed @{role_raw} in {actual_turns} turns")
                     
-                    # --- Profiling: Load and Inject Profile ---
-                    profile_context = ""
-                    if profile_manager:
-                         profile = profile_manager.get_profile(name=role_raw, role=role_raw)
-                         profile_context = f"\n\n=== AGENT PROFILE ===\n"
-                         profile_context += f"Identity: {profile.name} (Level {profile.level} {profile.role})\n"
-                         profile_context += f"XP: {profile.total_xp} | Success Rate: {profile.stats.get('success_rate', 0)}%\n"
-                         if profile.skills:
-                             profile_context += f"Skills: {', '.join(profile.skills)}\n"
-
-                    # --- Memory Recall ---
-                    memory_context = ""
-                    if memory_bank and memory_bank.enable_memory:
-                        try:
-                            relevant_memories = memory_bank.recall(query=desc, top_k=3)
-                            if relevant_memories:
-                                log(f"    [Task {task_index+1}] Found {len(relevant_memories)} relevant memories")
-                                memory_context = "\n\n=== RELEVANT PAST EXPERIENCES (MEMORY BANK) ===\n"
-                                memory_context += "Use these insights to guide your implementation and avoid past errors:\n"
-                                for i, mem in enumerate(relevant_memories, 1):
-                                    relevance = 1 - mem.get('distance', 1.0)
-                                    mem_type = mem.get('metadata', {}).get('memory_type', 'unknown')
-                                    memory_context += f"{i}. [{relevance:.0%} relevant] ({mem_type}) {mem['content']}\n"
-                                memory_context += "===============================================\n"
-                        except Exception as mem_err:
-                            log(f"    [Memory Recall] Failed: {mem_err}")
+                # Record actual usage
+                record_turn_usage(desc, actual_turns)
                     
-                    # --- Messaging Injection ---
-                    messaging_context = ""
-                    if messaging_manager:
-                        pending_messages = messaging_manager.get_messages(recipient=role_raw)
-                        # Filter for unread or relevant context if needed, for now we show all 'pending' 
-                        # In a real system we might track 'read' state per agent-task session.
-                        # For now, we show strictly all messages for them.
-                        if pending_messages:
-                            log(f"    [Task {task_index+1}] Injecting {len(pending_messages)} pending messages for @{role_raw}")
-                            messaging_context = "\n\n=== ✉️ PENDING MESSAGES ===\n"
-                            messaging_context += "You have unread messages. Review and acknowledge them immediately:\n"
-                            for msg in pending_messages:
-                                msg_type = msg.get('message_type', 'info').upper()
-                                is_broadcast = " (BROADCAST)" if msg.get('recipient') == 'all' else ""
-                                messaging_context += f"- [{msg['timestamp']}] FROM @{msg['sender']} [{msg_type}]{is_broadcast}: {msg['content']}\n"
-                            messaging_context += "===========================\n"
-
-                    full_instruction = f"{framework_instruction}\n\n{instruction}\n{profile_context}\n{project_context_instruction}\n{memory_context}\n{messaging_context}\n\nTask: {desc}"
+                # Record success for circuit breaker
+                if guardrails:
+                    guardrails.record_action(desc, success=True)
+                        
+                # Update Profile (XP)
+                if profile_manager:
+                    points = 10 # Default base XP
+                    if isinstance(task_meta.get('POINTS'), int):
+                        points = task_meta['POINTS'] * 10
+                    profile_manager.update_profile(role_raw, xp_gain=points, success=True, turns=actual_turns)
                     
-                    # Add status-specific instructions
-                    if status == "in_progress":
-                        resume_instruction = (
-                            "\n\n=== RESUME NOTICE ===\n"
-                            "This task is marked as IN_PROGRESS from a previous session.\n"
-                            "Search for existing files, code, or partial work in the workspace before starting.\n"
-                            "Resume where it left off if possible. Review any existing implementation.\n"
-                            "==================="
-                        )
-                        full_instruction += resume_instruction
-                        log(f"    [Task {task_index+1}] Adding RESUME instruction")
+                # DIRECT UPDATE: Mark done
+                await state_writer.submit(desc, "[x]")
                     
-                    elif status == "blocked":
-                        unblock_instruction = (
-                            "\n\n=== UNBLOCK NOTICE ===\n"
-                            "This task was previously BLOCKED.\n"
-                        )
-                        if blocker_reason:
-                            unblock_instruction += f"Previous blocker: {blocker_reason}\n"
-                        unblock_instruction += (
-                            "Investigate the root cause, check logs, verify dependencies, and attempt to resolve the blocker.\n"
-                            "If still blocked after investigation, document the reason clearly in your response.\n"
-                            "======================"
+                # Store success in memory
+                if memory_bank and memory_bank.enable_memory:
+                    try:
+                        memory_bank.store(
+                            content=f"Task '{desc}' completed successfully by {role_raw}",
+                            memory_type="task_outcome",
+                            metadata={
+                                "role": role_raw,
+                                "turns": actual_turns,
+                                "status": "success",
+                                "sprint_file": sprint_file
+                            }
                         )
-                        full_instruction += unblock_instruction
-                    
-                    # Inject Reviewer Notes if any
-                    if "reviewer_note" in task_info:
-                        full_instruction += task_info["reviewer_note"]
-                        log(f"    [Task {task_index+1}] Injected Reviewer Warnings")
-                        log(f"    [Task {task_index+1}] Adding UNBLOCK instruction" + (f" (Reason: {blocker_reason})" if blocker_reason else ""))
+                    except Exception as mem_e:
+                        log(f"    [Memory Store] Failed to store success: {mem_e}")
+
+            except Exception as e:
+                log(f"    [Task {task_index+1}] FAILED @{role_raw}: {e}")
                     
-                    agent = agent_factory(
-                        name=agent_name,
-                        instruction=full_instruction,
-                        tools=worker_tools,
-                        agent_role=role  # Pass role for optimal model selection
-                    )
-
-                    worker_pid = f"worker_{task_index}_{os.urandom(4).hex()}" 
-                    await session_service.create_session(
-                        app_name="SprintRunner", 
-                        user_id="user", 
-                        session_id=worker_pid
-                    )
-                    runner = Runner(
-                        app_name="SprintRunner", 
-                        agent=agent, 
-                        session_service=session_service
-                    )
-
-                    @retry_decorator
-                    async def run_agent():
-                        turn_count = 0
-                        # Initialize budget from metadata if available, else default
-                        initial_budget = parse_task_metadata(desc, 'TURNS_ESTIMATED', default=40)
-                        soft_limit = max(40, initial_budget)
-                        hard_limit = soft_limit * 2  # Progressive limit: 2x safety buffer
-                        log(f"    [Agent {role_raw}] Starting with soft limit: {soft_limit}, hard limit: {hard_limit}")
+                # Record failure for circuit breaker
+                if guardrails:
+                    guardrails.record_action(desc, success=False)
                         
-                        async for event in runner.run_async(
-                            user_id="user", 
-                            session_id=worker_pid, 
-                            new_message=types.Content(parts=[types.Part(text=f"Execute this task: {desc}")])
-                        ):
-                            turn_count += 1
-                            
-                            # Check for budget updates from tool calls
-                            if event.content and event.content.parts:
-                                for part in event.content.parts:
-                                    if part.text:
-                                        msg = f"[Agent {role_raw}] Thought: {part.text}"
-                                        logger.info(msg)
-                                        print(msg)
-                                    if getattr(part, 'function_call', None):
-                                        msg = f"[Agent {role_raw}] Call: {part.function_call.name}({part.function_call.args})"
-                                        logger.info(msg)
-                                        print(msg)
-                                        
-                                        # Dynamic Budget Update
-                                        if part.function_call.name == "request_turn_budget":
-                                            try:
-                                                # args is a dict or struct, need to parse
-                                                args = part.function_call.args
-                                                if isinstance(args, dict):
-                                                    est = args.get('estimated_turns', 20)
-                                                else:
-                                                    # Handle proto Struct conversion if needed
-                                                    est = args['estimated_turns']
-                                                
-                                                # Progressive limits: soft = estimate, hard = 2x
-                                                soft_limit = max(20, int(est))
-                                                hard_limit = soft_limit * 2
-                                                log(f"    [Agent {role_raw}] Budget UPDATED - Soft: {soft_limit}, Hard: {hard_limit}")
-                                            except Exception as ex:
-                                                logger.error(f"Failed to parse turn budget update: {ex}")
-
-                            # Progressive limit enforcement
-                            if turn_count > soft_limit and turn_count <= hard_limit:
-                                overage = turn_count - soft_limit
-                                remaining = hard_limit - turn_count
-                                msg = f"[Agent {role_raw}] ⚠️  WARNING: Exceeded estimate by {overage} turns, {remaining} turns until hard limit"
-                                logger.warning(msg)
-                                print(msg)
-                            
-                            if turn_count > hard_limit:
-                                msg = f"[Agent {role_raw}] ❌ EXCEEDED HARD LIMIT ({hard_limit}). Killing."
-                                logger.error(msg)
-                                print(msg) # Print to stdout for test capture
-                                raise RuntimeError(f"Task exceeded hard limit ({hard_limit})")
-
-                        return turn_count
-
-                    actual_turns = 0
+                # Update Profile (Failure)
+                if profile_manager:
+                    profile_manager.update_profile(role_raw, xp_gain=1, success=False, turns=actual_turns)
+                    
+                # Store failure in memory
+                if memory_bank and memory_bank.enable_memory:
                     try:
-                        actual_turns = await run_agent()
-                        log(f"    [Task {task_index+1}] Completed @{role_raw} in {actual_turns} turns")
-                        
-                        # Record actual usage
-                        record_turn_usage(desc, actual_turns)
-                        
-                        # Record success for circuit breaker
-                        if guardrails:
-                            guardrails.record_action(desc, success=True)
-                            
-                        # Update Profile (XP)
-                        if profile_manager:
-                            points = 10 # Default base XP
-                            if "POINTS:" in desc:
-                                try:
-                                    points = int(desc.split("POINTS:")[1].split("|")[0].split("]")[0]) * 10
-                                except:
-                                    pass
-                            profile_manager.update_profile(role_raw, xp_gain=points, success=True, turns=actual_turns)
-                        
-                        # DIRECT UPDATE: Mark done
-                        await update_sprint_task_status(desc, "[x]", SprintConfig.get_sprint_dir())
-                        
-                        # Store success in memory
-                        if memory_bank and memory_bank.enable_memory:
-                            try:
-                                memory_bank.store(
-                                    content=f"Task '{desc}' completed successfully by {role_raw}",
-                                    memory_type="task_outcome",
-                                    metadata={
-                                        "role": role_raw,
-                                        "turns": actual_turns,
-                                        "status": "success",
-                                        "sprint_file": sprint_file
-                                    }
-                                )
-                            except Exception as mem_e:
-                                log(f"    [Memory Store] Failed to store success: {mem_e}")
-
-                    except Exception as e:
-                        log(f"    [Task {task_index+1}] FAILED @{role_raw}: {e}")
-                        
-                        # Record failure for circuit breaker
-                        if guardrails:
-                            guardrails.record_action(desc, success=False)
-                            
-                        # Update Profile (Failure)
-                        if profile_manager:
-                            profile_manager.update_profile(role_raw, xp_gain=1, success=False, turns=actual_turns)
-                        
-                        # Store failure in memory
-                        if memory_bank and memory_bank.enable_memory:
-                            try:
-                                memory_bank.store(
-                                    content=f"Task '{desc}' failed: {str(e)}",
-                                    memory_type="error_resolution",
-                                    metadata={
-                                        "role": role_raw,
-                                        "error": str(e),
-                                        "status": "failed",
-                                        "sprint_file": sprint_file
-                                    }
-                                )
-                            except Exception as mem_e:
-                                log(f"    [Memory Store] Failed to store error: {mem_e}")
-                        # Record partial usage (best effort)
-                        # Note: We can't easily get partial turn count here as it's local to run_agent
-                        # Unless run_agent returns it in exception or we track it externally.
-                        # For now, we skip partial recording on failure or implement retry logic
-                        
-                        # Track failure for retry limit
-                        task_retry_tracker[desc] = task_retry_tracker.get(desc, 0) + 1
-                        # Mark as blocked if it fails
-                        await update_sprint_task_status(desc, "[!]", SprintConfig.get_sprint_dir())
-                
-                finally:
-                    # Reset messaging context
-                    if 'messaging_token' in locals() and messaging_token:
-                        current_messaging_context.reset(messaging_token)
+                        memory_bank.store(
+                            content=f"Task '{desc}' failed: {str(e)}",
+                            memory_type="error_resolution",
+                            metadata={
+                                "role": role_raw,
+                                "error": str(e),
+                                "status": "failed",
+                                "sprint_file": sprint_file
+                            }
+                        )
+                    except Exception as mem_e:
+                        log(f"    [Memory Store] Failed to store error: {mem_e}")
+                # Record partial usage (best effort)
+                # Note: We can't easily get partial turn count here as it's local to run_agent
+                # Unless run_agent returns it in exception or we track it externally.
+                # For now, we skip partial recording on failure or implement retry logic
                     
-                    # Notify the queue that the "unit of work" is complete
-                    queue.task_done()
+                # Track failure for retry limit
+                task_retry_tracker[task_index] = task_retry_tracker.get(task_index, 0) + 1
+                # Mark as blocked if it fails
+                await state_writer.submit(desc, "[!]", blocker_reason=f"Agent failed: {e}")
+            finally:
+                await _release_session(session_service, worker_pid)
             
-            except asyncio.CancelledError:
-                break
+        finally:
+            # Reset messaging context
+            if messaging_token:
+                current_messaging_context.reset(messaging_token)
+
+    # A fixed pool of workers pulls tasks off one shared iterator, so only
+    # concurrency_limit coroutines exist however long the sprint is.
+    # A crash in one task must not cancel its siblings, so it is logged and
+    # the worker moves on; cancelling this coroutine still cancels every
+    # worker via gather.
+    pending = enumerate(tasks_to_execute)
+    
+    async def worker():
+        for idx, task in pending:
+            try:
+                await run_one(idx, task)
             except Exception as e:
-                log(f"Worker {worker_id} crashed: {e}")
-                # Don't let a worker crash kill the whole thing, unless we want it to.
-                # But we should probably restart it or just let it die if we have others.
-                # For now, just log and continue loop unless it's critical.
-                # If we used queue.task_done() inside the inner try/finally, we are good.
-                pass
+                log(f"    [Task {idx+1}] crashed: {e!r}")
+    
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(concurrency_limit, len(tasks_to_execute)))))
+    finally:
+        # QA and the next cycle read the sprint file, so drain before returning
+        await state_writer.close()
+    
+    return tasks_to_execute
 
-    # Start workers
-    workers = []
-    for i in range(concurrency_limit):
-        w = asyncio.create_task(worker(i))
-        workers.append(w)
+async def _release_session(session_service, session_id):
+    """
+    Delete a finished run's session. Every run gets a fresh session and none
+    is read back afterwards, so keeping them would only grow the in-memory
+    store with each task's full event history.
+    """
+    try:
+        await session_service.delete_session(app_name="SprintRunner", user_id="user", session_id=session_id)
+    except Exception as e:
+        log(f"    [Session] Failed to release {session_id}: {e}")
 
-    # Wait until the queue is fully processed
-    await queue.join()
+def _seed_content(seed_message):
+    """
+    Content for a phase seed message. Callers build it once per phase call,
+    outside the retried _run_agent_loop, so retries resend the same object.
+    It is not shared across phases: the runner may modify new_message in place.
+    """
+    return types.Content(parts=[types.Part(text=seed_message)])
 
-    # Cancel our worker tasks
-    for w in workers:
-        w.cancel()
+@retry_decorator
+async def _run_agent_loop(runner, session_id, seed_content, tag, max_turns, what,
+                          messaging_manager=None, on_call=None):
+    """
+    Drive a single-agent phase run (DevOps setup, QA, demo, retro): send the
+    seed message, log the agent's thoughts and calls, and enforce max_turns.
     
-    # Wait until all worker tasks are cancelled
-    await asyncio.gather(*workers, return_exceptions=True)
+    Args:
+        seed_content: The seed message as built by _seed_content()
+        tag: Log prefix and messaging role, e.g. "QA"
+        what: Phase description used in the max-turns error
+        messaging_manager: If given, the agent's tool calls see its inbox as @tag
+        on_call: Optional callback invoked with every function call part
+    """
+    token = None
+    if messaging_manager:
+        token = current_messaging_context.set({
+            "manager": messaging_manager,
+            "role": tag,
+            "seen_ids": set()
+        })
     
-    return tasks_to_execute
+    try:
+        turn_count = 0
+        info = logger.info
+        async for event in runner.run_async(
+            user_id="user", 
+            session_id=session_id, 
+            new_message=seed_content
+        ):
+            turn_count += 1
+            if turn_count > max_turns:
+                log(f"[{tag}] EXCEEDED MAX TURNS ({max_turns}). Stopping.")
+                raise RuntimeError(f"{what} exceeded max turns ({max_turns})")
+            parts = event.content.parts if event.content else None
+            if not parts:
+                continue
+            for part in parts:
+                text, fc = part.text, getattr(part, 'function_call', None)
+                if text:
+                    info("[%s] Thought: %s", tag, text)
+                if fc:
+                    info("[%s] Call: %s(%s)", tag, fc.name, fc.args)
+                    if on_call:
+                        on_call(fc)
+    finally:
+        if token:
+            current_messaging_context.reset(token)
 
 # --- Phase 2: QA & Validation ---
 async def run_qa_phase(session_service, framework_instruction, sprint_file, agent_factory=default_agent_factory, messaging_manager=None, focused_tasks=None):
@@ -747,14 +1094,19 @@ async def run_qa_phase(session_service, framework_instruction, sprint_file, agen
     await update_sprint_header("QA", SprintConfig.get_sprint_dir())
     
     all_tasks = get_all_sprint_tasks(sprint_file)
-    review_tasks = [t for t in all_tasks if t['status'] == 'done']
     
-    # Focused QA: Only verify tasks that were attempted/modified in this cycle
+    # Focused QA: Only verify tasks that were attempted/modified in this cycle.
+    # Status and focus are checked in the same pass over the sprint's tasks.
     if focused_tasks is not None:
-        focused_descs = set(t['desc'] for t in focused_tasks)
-        # Filter review tasks to only those in the focused set
-        review_tasks = [t for t in review_tasks if t['desc'] in focused_descs]
+        # Compared without blocker tags: a task that failed before passing may still carry one
+        focused_descs = {strip_blocker_tag(t.desc) for t in focused_tasks}
+        review_tasks = [
+            t for t in all_tasks
+            if t['status'] == 'done' and strip_blocker_tag(t['desc']) in focused_descs
+        ]
         log(f"    [Focused QA] Restricted verification to {len(review_tasks)} tasks executed this cycle.")
+    else:
+        review_tasks = [t for t in all_tasks if t['status'] == 'done']
 
     if not review_tasks:
         log("    No tasks to review.")
@@ -763,28 +1115,16 @@ async def run_qa_phase(session_service, framework_instruction, sprint_file, agen
     task_list_str = "\n".join([f"- {t['desc']} (@{t['role']})" for t in review_tasks])
     log(f"    Verifying {len(review_tasks)} tasks...")
 
-    qa_prompt_path = os.path.join(SprintConfig.PROMPT_BASE_DIR, "agent_qa.md")
-    if os.path.exists(qa_prompt_path):
-        with open(qa_prompt_path, "r", encoding="utf-8") as f:
-             qa_instruction = sanitize_prompt_for_adk(f.read())
-    else:
-        qa_instruction = "You are the QA Engineer."
-
     qa_full_instruction = (
-        f"{framework_instruction}\n\n{qa_instruction}\n\n"
+        f"{_phase_instruction(framework_instruction, 'agent_qa.md', 'You are the QA Engineer.')}\n\n"
         f"Tasks to Verify:\n{task_list_str}\n\n"
         "Execute the QA workflow defined in your agent prompt for the above tasks."
     )
 
-    # Load DevOps QA Setup prompt
-    devops_qa_setup_prompt_path = os.path.join(SprintConfig.PROMPT_BASE_DIR, "agent_devops.md")  # Consolidated QA setup in main DevOps prompt
-    if os.path.exists(devops_qa_setup_prompt_path):
-        with open(devops_qa_setup_prompt_path, "r", encoding="utf-8") as f:
-            devops_setup_instruction = sanitize_prompt_for_adk(f.read())
-    else:
-        devops_setup_instruction = "Prepare the test environment for QA execution."
-
-    devops_full_instruction = f"{framework_instruction}\n\n{devops_setup_instruction}"
+    # DevOps QA setup is consolidated in the main DevOps prompt
+    devops_full_instruction = _phase_instruction(
+        framework_instruction, "agent_devops.md", "Prepare the test environment for QA execution."
+    )
 
     devops_agent = agent_factory(
         name="DevOps_Setup",
@@ -793,11 +1133,12 @@ async def run_qa_phase(session_service, framework_instruction, sprint_file, agen
         agent_role="DevOps"
     )
 
-    devops_pid = f"devops_setup_{os.urandom(4).hex()}"
-    await session_service.create_session(
-        app_name="SprintRunner", 
-        user_id="user", 
-        session_id=devops_pid
+    # Both sessions are known up front, so create them together
+    devops_pid = f"devops_setup_{_next_session_seq()}"
+    qa_pid = f"qa_session_{_next_session_seq()}"
+    await asyncio.gather(
+        session_service.create_session(app_name="SprintRunner", user_id="user", session_id=devops_pid),
+        session_service.create_session(app_name="SprintRunner", user_id="user", session_id=qa_pid)
     )
     devops_runner = Runner(
         app_name="SprintRunner", 
@@ -805,108 +1146,64 @@ async def run_qa_phase(session_service, framework_instruction, sprint_file, agen
         session_service=session_service
     )
 
-    @retry_decorator
-    async def run_devops_setup():
-        # Set messaging context
-        token = None
-        if messaging_manager:
-            token = current_messaging_context.set({
-                "manager": messaging_manager,
-                "role": "DevOps",
-                "seen_ids": set()
-            })
-            
-        try:
-            turn_count = 0
-            max_turns = 40  # Reverted: progressive limits handle buffers
-            async for event in devops_runner.run_async(
-                user_id="user", 
-                session_id=devops_pid, 
-                new_message=types.Content(parts=[types.Part(text="Setup environment for QA.")])
-            ):
-                turn_count += 1
-                if turn_count > max_turns:
-                     log(f"[DevOps] EXCEEDED MAX TURNS ({max_turns}). Stopping setup.")
-                     raise RuntimeError(f"DevOps setup exceeded max turns ({max_turns})")
-                if event.content and event.content.parts:
-                    for part in event.content.parts:
-                        if part.text:
-                            logger.info(f"[DevOps] Thought: {part.text}")
-                        if getattr(part, 'function_call', None):
-                            logger.info(f"[DevOps] Call: {part.function_call.name}({part.function_call.args})")
-        finally:
-            if token:
-                current_messaging_context.reset(token)
+    # QA agent setup doesn't depend on the environment, so build it while
+    # the DevOps agent is still working
+    async def prepare_qa_runner():
+        qa_agent = agent_factory(
+            name="QA_Engineer",
+            instruction=qa_full_instruction,
+            tools=qa_tools,
+            agent_role="QA"  # Use Pro model for comprehensive testing
+        )
+        return Runner(
+            app_name="SprintRunner", 
+            agent=qa_agent, 
+            session_service=session_service
+        )
 
-    await run_devops_setup()
+    try:
+        _, runner = await safe_gather(
+            _run_agent_loop(
+                devops_runner, devops_pid, _seed_content("Setup environment for QA."), "DevOps",
+                max_turns=40,  # Reverted: progressive limits handle buffers
+                what="DevOps setup",
+                messaging_manager=messaging_manager
+            ),
+            prepare_qa_runner()
+        )
+    except BaseException:
+        # QA never starts, so its session would otherwise be left behind
+        await _release_session(session_service, qa_pid)
+        raise
+    finally:
+        await _release_session(session_service, devops_pid)
     log("    [QA Phase] Environment Setup Complete. Starting QA Agent...")
     # ----------------------------------------
-
-    qa_agent = agent_factory(
-        name="QA_Engineer",
-        instruction=qa_full_instruction,
-        tools=qa_tools,
-        agent_role="QA"  # Use Pro model for comprehensive testing
-    )
-
-    qa_pid = f"qa_session_{os.urandom(4).hex()}"
-    await session_service.create_session(
-        app_name="SprintRunner", 
-        user_id="user", 
-        session_id=qa_pid
-    )
-    runner = Runner(
-        app_name="SprintRunner", 
-        agent=qa_agent, 
-        session_service=session_service
-    )
     
     defects_created = False
     
-    @retry_decorator
-    async def run_qa():
-        # Set messaging context
-        token = None
-        if messaging_manager:
-            token = current_messaging_context.set({
-                "manager": messaging_manager,
-                "role": "QA",
-                "seen_ids": set()
-            })
-        
-        try:
-            nonlocal defects_created
-            turn_count = 0
-            max_turns = 100  # Increased from 40 to handle complex QA scenarios
-            async for event in runner.run_async(
-                user_id="user", 
-                session_id=qa_pid, 
-                new_message=types.Content(parts=[types.Part(text="Begin QA verification.")])
-            ):
-                turn_count += 1
-                if turn_count > max_turns:
-                     log(f"[QA] EXCEEDED MAX TURNS ({max_turns}). Stopping.")
-                     raise RuntimeError(f"QA verification exceeded max turns ({max_turns})")
-                if event.content and event.content.parts:
-                    for part in event.content.parts:
-                        if part.text:
-                            logger.info(f"[QA] Thought: {part.text}")
-                        if getattr(part, 'function_call', None):
-                            logger.info(f"[QA] Call: {part.function_call.name}({part.function_call.args})")
-                            if part.function_call.name == "add_sprint_task":
-                                defects_created = True
-                            elif part.function_call.name == "update_sprint_task_status":
-                                # If QA re-opens a task (Todo or Blocked), treat it as a defect/work-item finding
-                                args = part.function_call.args
-                                status = args.get("status", "")
-                                if status in ["[ ]", "[!]"]:
-                                    defects_created = True
-                                    log(f"    [QA] Task re-opened/blocked ({status}). Will trigger execution loop.")
-        finally:
-            if token:
-                current_messaging_context.reset(token)
+    def on_qa_call(fc):
+        nonlocal defects_created
+        if fc.name == "add_sprint_task":
+            defects_created = True
+        elif fc.name == "update_sprint_task_status":
+            # If QA re-opens a task (Todo or Blocked), treat it as a defect/work-item finding
+            args = fc.args
+            status = args.get("status", "")
+            if status in ["[ ]", "[!]"]:
+                defects_created = True
+                log(f"    [QA] Task re-opened/blocked ({status}). Will trigger execution loop.")
 
-    await run_qa()
+    try:
+        await _run_agent_loop(
+            runner, qa_pid, _seed_content("Begin QA verification."), "QA",
+            max_turns=100,  # Increased from 40 to handle complex QA scenarios
+            what="QA verification",
+            messaging_manager=messaging_manager,
+            on_call=on_qa_call
+        )
+    finally:
+        await _release_session(session_service, qa_pid)
     
     if defects_created:
         log("    [QA] Defects were found (New or Re-opened). Rerunning execution phase...")
@@ -916,18 +1213,18 @@ async def run_qa_phase(session_service, framework_instruction, sprint_file, agen
     return False
 
 # --- Phase 3: Demo ---
-async def run_demo_phase(session_service, framework_instruction, sprint_file, agent_factory=default_agent_factory, input_callback=None, messaging_manager=None):
-    log("\n[Phase 3] Demo & Feedback")
+async def prepare_demo_runner(session_service, framework_instruction, agent_factory=default_agent_factory):
+    """
+    Build the demo Orchestrator agent, its session and Runner.
+    Nothing here depends on the sprint outcome, so run_cycle can warm it up
+    while QA is still running.
     
-    # Load Demo Orchestrator prompt
-    demo_prompt_path = os.path.join(SprintConfig.PROMPT_BASE_DIR, "agent_orchestrator_demo.md")
-    if os.path.exists(demo_prompt_path):
-        with open(demo_prompt_path, "r", encoding="utf-8") as f:
-            demo_instruction = sanitize_prompt_for_adk(f.read())
-    else:
-        demo_instruction = "Prepare a Demo Walkthrough."
-
-    orchestrator_full_instruction = f"{framework_instruction}\n\n{demo_instruction}"
+    Returns:
+        (session_id, runner) tuple
+    """
+    orchestrator_full_instruction = _phase_instruction(
+        framework_instruction, "agent_orchestrator_demo.md", "Prepare a Demo Walkthrough."
+    )
     
     orchestrator_agent = agent_factory(
         name="Orchestrator",
@@ -936,51 +1233,39 @@ async def run_demo_phase(session_service, framework_instruction, sprint_file, ag
         agent_role="Orchestrator"  # Use Pro model for coordination
     )
     
+    demo_pid = f"demo_session_{_next_session_seq()}"
     await session_service.create_session(
         app_name="SprintRunner", 
         user_id="user", 
-        session_id="demo_session"
+        session_id=demo_pid
     )
     runner = Runner(
         app_name="SprintRunner", 
         agent=orchestrator_agent, 
         session_service=session_service
     )
-    
-    @retry_decorator
-    async def run_demo():
-        # Set messaging context
-        token = None
-        if messaging_manager:
-            token = current_messaging_context.set({
-                "manager": messaging_manager,
-                "role": "Orchestrator",
-                "seen_ids": set()
-            })
-        
-        try:
-            turn_count = 0
-            max_turns = 20
-            async for event in runner.run_async(
-                user_id="user", 
-                session_id="demo_session", 
-                new_message=types.Content(parts=[types.Part(text="Create the demo walkthrough.")])
-            ):
-                turn_count += 1
-                if turn_count > max_turns:
-                     log(f"[Orchestrator] EXCEEDED MAX TURNS ({max_turns}). Stopping.")
-                     raise RuntimeError(f"Demo walkthrough generation exceeded max turns ({max_turns})")
-                if event.content and event.content.parts:
-                    for part in event.content.parts:
-                        if part.text:
-                            logger.info(f"[Orchestrator] Thought: {part.text}")
-                        if getattr(part, 'function_call', None):
-                            logger.info(f"[Orchestrator] Call: {part.function_call.name}({part.function_call.args})")
-        finally:
-            if token:
-                current_messaging_context.reset(token)
+    return demo_pid, runner
 
-    await run_demo()
+async def run_demo_phase(session_service, framework_instruction, sprint_file, agent_factory=default_agent_factory, input_callback=None, messaging_manager=None, prepared=None, timeout=None):
+    log("\n[Phase 3] Demo & Feedback")
+    
+    # prepared: (session_id, runner) from prepare_demo_runner, if already warmed up
+    demo_pid, runner = prepared or await prepare_demo_runner(session_service, framework_instruction, agent_factory)
+    
+    # timeout bounds only the agent run; time spent waiting on human feedback
+    # below is not counted, and a timed-out input() thread would be orphaned
+    try:
+        await asyncio.wait_for(
+            _run_agent_loop(
+                runner, demo_pid, _seed_content("Create the demo walkthrough."), "Orchestrator",
+                max_turns=20,
+                what="Demo walkthrough generation",
+                messaging_manager=messaging_manager
+            ),
+            timeout=timeout
+        )
+    finally:
+        await _release_session(session_service, demo_pid)
     
     # Verify Demo Artifact
     demo_file = os.path.join(SprintConfig.get_sprint_dir(), "DEMO_WALKTHROUGH.md")
@@ -993,8 +1278,13 @@ async def run_demo_phase(session_service, framework_instruction, sprint_file, ag
     
     feedback = ""
     # Capture Feedback
+    # Waiting on a human must not stall the event loop (and the shared
+    # client's keep-alive connections), so blocking prompts run in a thread
     if input_callback:
-        feedback = input_callback("    Feedback: > ")
+        if asyncio.iscoroutinefunction(input_callback):
+            feedback = await input_callback("    Feedback: > ")
+        else:
+            feedback = await asyncio.to_thread(input_callback, "    Feedback: > ")
     else:
         # Default to non-interactive if NO TTY or Env var set
         is_interactive = sys.stdin.isatty() and not os.environ.get("NON_INTERACTIVE")
@@ -1005,29 +1295,34 @@ async def run_demo_phase(session_service, framework_instruction, sprint_file, ag
         else:
             try:
                 print("    >> Please enter your feedback for this sprint (or press Enter to skip):")
-                feedback = input("    Feedback: > ")
+                feedback = await asyncio.to_thread(input, "    Feedback: > ")
             except EOFError:
                 feedback = "No feedback provided (EOF)."
         
     return feedback
 
 # --- Phase 4: Retro ---
-async def run_retro_phase(session_service, framework_instruction, sprint_file, demo_feedback, agent_factory=default_agent_factory):
+async def run_retro_phase(session_service, framework_instruction, sprint_file, demo_feedback, agent_factory=default_agent_factory, tasks_executed=True):
     log("\n[Phase 4] Retrospective")
-    await update_sprint_header("Review", SprintConfig.get_sprint_dir())
-    
-    # Load PM Retrospective prompt
-    retro_prompt_path = os.path.join(SprintConfig.PROMPT_BASE_DIR, "agent_pm_retrospective.md")
-    if os.path.exists(retro_prompt_path):
-        with open(retro_prompt_path, "r", encoding="utf-8") as f:
-            pm_retro_instruction = sanitize_prompt_for_adk(f.read())
-            # Inject user feedback into the template
-            user_feedback_text = demo_feedback if demo_feedback else "None provided."
-            pm_retro_instruction = pm_retro_instruction.replace("{user_feedback}", user_feedback_text)
+    sprint_dir = SprintConfig.get_sprint_dir()
+    
+    # The retro reviews the QA report and demo walkthrough; with neither on
+    # disk and no work done this run there is nothing for it to look at
+    if not tasks_executed and not any(
+        os.path.exists(os.path.join(sprint_dir, name)) for name in ("QA_REPORT.md", "DEMO_WALKTHROUGH.md")
+    ):
+        log("    Retrospective skipped: no tasks executed and no QA report or demo walkthrough to review.")
+        return
+    
+    await update_sprint_header("Review", sprint_dir)
+    
+    retro_parts = _retro_template_parts(framework_instruction)
+    if retro_parts is not None:
+        # Inject user feedback into the (cached, pre-split) template
+        user_feedback_text = demo_feedback if demo_feedback else "None provided."
+        pm_full_instruction = user_feedback_text.join(retro_parts)
     else:
-        pm_retro_instruction = "Conduct sprint retrospective."
-
-    pm_full_instruction = f"{framework_instruction}\n\n{pm_retro_instruction}"
+        pm_full_instruction = _phase_instruction(framework_instruction, "agent_pm_retrospective.md", "Conduct sprint retrospective.")
 
     pm_agent = agent_factory(
         name="ProductManager",
@@ -1036,10 +1331,11 @@ async def run_retro_phase(session_service, framework_instruction, sprint_file, d
         agent_role="PM"  # Use Flash model for quality requirements
     )
     
+    retro_pid = f"retro_session_{_next_session_seq()}"
     await session_service.create_session(
         app_name="SprintRunner", 
         user_id="user", 
-        session_id="retro_session"
+        session_id=retro_pid
     )
     runner = Runner(
         app_name="SprintRunner", 
@@ -1047,21 +1343,14 @@ async def run_retro_phase(session_service, framework_instruction, sprint_file, d
         session_service=session_service
     )
     
-    @retry_decorator
-    async def run_retro():
-        turn_count = 0
-        max_turns = 40
-        async for event in runner.run_async(
-            user_id="user", 
-            session_id="retro_session", 
-            new_message=types.Content(parts=[types.Part(text="Conduct Retrospective.")])
-        ):
-            turn_count += 1
-            if turn_count > max_turns:
-                 log(f"[PM] EXCEEDED MAX TURNS ({max_turns}). Stopping.")
-                 raise RuntimeError(f"Retrospective exceeded max turns ({max_turns})")
-             
-    await run_retro()
+    try:
+        await _run_agent_loop(
+            runner, retro_pid, _seed_content("Conduct Retrospective."), "PM",
+            max_turns=40,
+            what="Retrospective"
+        )
+    finally:
+        await _release_session(session_service, retro_pid)
     log("    Retrospective complete. Reports generated and Backlog updated.")
 
 # --- Lifecycle Runner ---
@@ -1083,6 +1372,10 @@ class SprintRunner:
         
         # Initialize Profiling
         self.profile_manager = ProfileManager(SprintConfig.get_sprint_dir())
+        
+        # Shared framework instructions, prepended to every agent's prompt
+        framework_index_path = os.path.join(SprintConfig.PROMPT_BASE_DIR, "agent_framework_index.md")
+        self.framework_instruction = _load_sanitized_prompt(framework_index_path) or ""
 
     async def run_cycle(self):
         SprintConfig.validate()
@@ -1095,8 +1388,10 @@ class SprintRunner:
         
         log(f"[*] Starting Sprint Runner for {latest_sprint}")
         
-        # Validate sprint state before execution
-        sprint_state = validate_sprint_state(latest_sprint)
+        # Validate sprint state before execution. The same parse feeds the
+        # first execution cycle; only the header changes in between.
+        sprint_parse = parse_sprint_file_once(latest_sprint)
+        sprint_state = validate_sprint_state(latest_sprint, status=sprint_parse[0])
         log(f"Sprint state: {sprint_state}")
         
         if sprint_state == 'completed':
@@ -1108,75 +1403,100 @@ class SprintRunner:
             log(f"This sprint needs to be populated by the PM agent before execution.")
             return
         
-        # Load shared framework instructions
-        framework_index_path = os.path.join(SprintConfig.PROMPT_BASE_DIR, "agent_framework_index.md")
-        framework_instruction = ""
-        if os.path.exists(framework_index_path):
-            with open(framework_index_path, "r", encoding="utf-8") as f:
-                framework_instruction = sanitize_prompt_for_adk(f.read())
+        framework_instruction = self.framework_instruction
 
         # == Execution Loop (Exec -> QA -> Defect -> Exec) ==
         loop_count = 0
         max_loops = 3 # Prevent infinite defect loops
         
-        while loop_count < max_loops:
-            loop_count += 1
-            log(f"\n=== SPRINT CYCLE {loop_count} ===")
+        # Demo always follows this loop, so its agent, session and Runner are
+        # built in the background while the first QA pass runs
+        demo_warmup = None
+        tasks_executed = 0
+        try:
+            while loop_count < max_loops:
+                loop_count += 1
+                log(f"\n=== SPRINT CYCLE {loop_count} ===")
             
-            # 1. Execute Pending
-            tasks_run = await run_parallel_execution(
-                self.session_service, 
-                framework_instruction, 
-                latest_sprint, 
-                self.agent_factory, 
-                memory_bank=self.memory_bank, 
-                guardrails=self.guardrails, 
-                profile_manager=self.profile_manager,
-                messaging_manager=self.messaging_manager
-            )
+                # 1. Execute Pending
+                tasks_run = await run_parallel_execution(
+                    self.session_service, 
+                    framework_instruction, 
+                    latest_sprint, 
+                    self.agent_factory, 
+                    memory_bank=self.memory_bank, 
+                    guardrails=self.guardrails, 
+                    profile_manager=self.profile_manager,
+                    messaging_manager=self.messaging_manager,
+                    parsed=sprint_parse if loop_count == 1 else None
+                )
+                tasks_executed += len(tasks_run)
             
-            # 2. QA
-            defects_found = await run_qa_phase(
-                self.session_service, framework_instruction, latest_sprint, self.agent_factory,
-                messaging_manager=self.messaging_manager,
-                focused_tasks=tasks_run
-            )
+                # 2. QA
+                if demo_warmup is None:
+                    demo_warmup = asyncio.create_task(prepare_demo_runner(
+                        self.session_service, framework_instruction, self.agent_factory
+                    ))
+                defects_found = await run_qa_phase(
+                    self.session_service, framework_instruction, latest_sprint, self.agent_factory,
+                    messaging_manager=self.messaging_manager,
+                    focused_tasks=tasks_run
+                )
             
-            if defects_found:
-                log("    [!] Defects found. Rerunning execution phase for new tasks...")
-                continue
-            else:
-                if len(tasks_run) == 0 and loop_count > 1:
-                    break
+                if defects_found:
+                    log("    [!] Defects found. Rerunning execution phase for new tasks...")
+                    continue
+                else:
+                    if len(tasks_run) == 0 and loop_count > 1:
+                        break
                     
-                if defects_found is False:
-                     log("    [+] QA passed. Proceeding to Demo.")
-                     break
+                    if defects_found is False:
+                         log("    [+] QA passed. Proceeding to Demo.")
+                         break
+        except BaseException:
+            if demo_warmup is not None:
+                demo_warmup.cancel()
+                await asyncio.gather(demo_warmup, return_exceptions=True)
+            raise
                 
         if loop_count >= max_loops:
             log("WARNING: Max sprint cycles reached. Proceeding to Retro despite potential issues.")
 
         # 3. Demo
-        try:
-            feedback = await asyncio.wait_for(
-                run_demo_phase(
+        prepared_demo = None
+        if demo_warmup is not None:
+            try:
+                prepared_demo = await demo_warmup
+            except Exception as e:
+                log(f"WARNING: Demo warm-up failed ({e}). Building it fresh.")
+        
+        if not tasks_executed:
+            # Nothing new to walk through, so don't spend an agent run on it
+            log("\n[Phase 3] Demo skipped: no tasks were executed this run.")
+            feedback = "No demo: no tasks were executed this run."
+            if prepared_demo:
+                await _release_session(self.session_service, prepared_demo[0])
+        else:
+            try:
+                feedback = await run_demo_phase(
                     self.session_service, framework_instruction, latest_sprint, self.agent_factory, self.input_callback,
-                    messaging_manager=self.messaging_manager
-                ),
-                timeout=300
-            )
-        except asyncio.TimeoutError:
-            log("WARNING: Demo phase timed out (300s). Proceeding to Retro.")
-            feedback = "Demo phase timed out."
-        except Exception as e:
-            log(f"WARNING: Demo phase failed: {e}")
-            feedback = "Demo phase failed."
+                    messaging_manager=self.messaging_manager,
+                    prepared=prepared_demo,
+                    timeout=300
+                )
+            except asyncio.TimeoutError:
+                log("WARNING: Demo phase timed out (300s). Proceeding to Retro.")
+                feedback = "Demo phase timed out."
+            except Exception as e:
+                log(f"WARNING: Demo phase failed: {e}")
+                feedback = "Demo phase failed."
         
         # 4. Retro
         try:
             await asyncio.wait_for(
                 run_retro_phase(
-                    self.session_service, framework_instruction, latest_sprint, feedback, self.agent_factory
+                    self.session_service, framework_instruction, latest_sprint, feedback, self.agent_factory,
+                    tasks_executed=bool(tasks_executed)
                 ),
                 timeout=300
             )
@@ -1251,6 +1571,15 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
     
+    # libuv-based loop for cheaper task switching in the agent loops.
+    # Optional: stock asyncio is used on Windows or when uvloop is missing.
+    if os.getenv("USE_UVLOOP", "true").lower() == "true":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+    
     try:
         asyncio.run(main(project_root=args.project_root))
     except Exception as e:
@@ -13,6 +13,7 @@ class SprintConfig:
     # Agent Settings
     MODEL_NAME = os.getenv("MODEL_NAME", "gemini-2.0-flash")
     CONCURRENCY_LIMIT = int(os.getenv("CONCURRENCY_LIMIT", "3"))
+    RPM_LIMIT = int(os.getenv("RPM_LIMIT", "60"))
     
     # Paths
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -91,6 +92,17 @@ class SprintConfig:
         # Return matched model or fall back to global default
         return model_mapping.get(normalized, cls.MODEL_NAME)
 
+    @classmethod
+    def get_rpm_limit(cls, model_name):
+        """
+        Get the requests-per-minute budget for a model.
+        
+        Environment Variable Overrides:
+            RPM_LIMIT_<MODEL> (e.g. RPM_LIMIT_GEMINI_2_5_PRO), falling back to RPM_LIMIT
+        """
+        env_key = "RPM_LIMIT_" + "".join(c if c.isalnum() else "_" for c in str(model_name).upper())
+        return int(os.getenv(env_key, cls.RPM_LIMIT))
+
     @classmethod
     def get_role_map(cls):
         return {
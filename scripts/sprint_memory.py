@@ -185,22 +185,71 @@ class SprintMemoryBank:
                 where=where_filter if where_filter else None
             )
             
-            # Format results
-            memories = []
-            if results['ids'] and results['ids'][0]:
-                for i in range(len(results['ids'][0])):
-                    memories.append({
-                        'memory_id': results['ids'][0][i],
-                        'content': results['documents'][0][i],
-                        'metadata': results['metadatas'][0][i],
-                        'distance': results['distances'][0][i] if results.get('distances') else 0.0
-                    })
-            
-            return memories
+            return self._format_results(results, 0)
         except Exception as e:
             print(f"Error recalling memory: {e}")
             return []
     
+    def recall_batch(
+        self,
+        queries: List[str],
+        memory_type: Optional[str] = None,
+        scope: Optional[str] = None,
+        top_k: int = 3
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieve relevant memories for several queries with a single vector search.
+        
+        Embedding and querying all texts in one call amortizes the per-query
+        overhead when many tasks are known up front (e.g. a sprint's task queue).
+        
+        Args:
+            queries: Search queries, one per task
+            memory_type: Filter by memory type
+            scope: Filter by scope
+            top_k: Number of results to return per query
+            
+        Returns:
+            One list of memory entries per query, in the same order as `queries`
+        """
+        if not self.enable_memory or not queries:
+            return [[] for _ in queries]
+        
+        try:
+            where_filter = {}
+            if memory_type:
+                where_filter["memory_type"] = memory_type
+            if scope:
+                where_filter["scope"] = scope
+            
+            if self.collection.count() == 0:
+                return [[] for _ in queries]
+
+            results = self.collection.query(
+                query_texts=list(queries),
+                n_results=top_k,
+                where=where_filter if where_filter else None
+            )
+            
+            return [self._format_results(results, row) for row in range(len(queries))]
+        except Exception as e:
+            print(f"Error recalling memory batch: {e}")
+            return [[] for _ in queries]
+    
+    @staticmethod
+    def _format_results(results: Dict[str, Any], row: int) -> List[Dict[str, Any]]:
+        """Convert one row of a ChromaDB query result into memory entries"""
+        memories = []
+        if results['ids'] and len(results['ids']) > row and results['ids'][row]:
+            for i in range(len(results['ids'][row])):
+                memories.append({
+                    'memory_id': results['ids'][row][i],
+                    'content': results['documents'][row][i],
+                    'metadata': results['metadatas'][row][i],
+                    'distance': results['distances'][row][i] if results.get('distances') else 0.0
+                })
+        return memories
+    
     def summarize_session(self, sprint_file: str) -> str:
         """
         Generate a concise summary of a sprint session for context injection.
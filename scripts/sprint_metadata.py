@@ -17,22 +17,36 @@ def parse_task_metadata(task_desc: str, key: str, default=None):
     Returns:
         Parsed value or default
     """
-    pattern = r'\[([^\]]+)\]'
-    match = re.search(pattern, task_desc)
+    return parse_task_metadata_all(task_desc).get(key.upper(), default)
+
+
+def parse_task_metadata_all(task_desc: str) -> dict:
+    """
+    Parse every KEY:VALUE metadata pair from a task description in one pass.
+    
+    Args:
+        task_desc: Task description with optional metadata
     
+    Returns:
+        Dict of upper-cased keys to values (int where possible), read from the
+        first bracket group only, like parse_task_metadata always has. If a key
+        repeats within that group, the first one wins.
+    """
+    metadata = {}
+    match = re.search(r'\[([^\]]+)\]', task_desc)
     if match:
-        metadata_str = match.group(1)
-        for pair in metadata_str.split('|'):
+        for pair in match.group(1).split('|'):
             if ':' in pair:
                 k, v = pair.split(':', 1)
-                if k.strip().upper() == key.upper():
-                    # Try to convert to int if possible
-                    try:
-                        return int(v.strip())
-                    except ValueError:
-                        return v.strip()
-    
-    return default
+                k = k.strip().upper()
+                if k in metadata:
+                    continue
+                # Try to convert to int if possible
+                try:
+                    metadata[k] = int(v.strip())
+                except ValueError:
+                    metadata[k] = v.strip()
+    return metadata
 
 
 def update_task_metadata_in_file(sprint_file: str, task_desc: str, new_metadata: dict) -> bool:
@@ -161,6 +175,28 @@ def update_task_status_in_file(sprint_file: str, task_desc: str, status: str) ->
     except Exception:
         return False
     
+    original = list(lines)
+    if apply_task_status(lines, task_desc, status) < 0:
+        return False
+    
+    if lines != original:
+        with open(sprint_file, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+    
+    return True
+
+def apply_task_status(lines: list, task_desc: str, status: str) -> int:
+    """
+    Update a task's status checkbox in-place within already-read sprint file lines.
+    
+    Args:
+        lines: Sprint file lines (as from readlines()), modified in place
+        task_desc: Task description to find (partial match)
+        status: New status string (e.g. "[x]", "[/]")
+    
+    Returns:
+        Index of the matched task line, or -1 if no task matched
+    """
     # Clean up the input task description for comparison
     clean_search = re.sub(r'\[.*?\]', '', task_desc)
     clean_search = re.sub(r'^[\s\-\*]+', '', clean_search)
@@ -190,7 +226,7 @@ def update_task_status_in_file(sprint_file: str, task_desc: str, status: str) ->
             best_idx = i
             
     if best_ratio < 0.6:
-        return False
+        return -1
         
     # 2. Update Phase
     target_line = lines[best_idx]
@@ -199,10 +235,5 @@ def update_task_status_in_file(sprint_file: str, task_desc: str, status: str) ->
     # - [ ] or - [x] or - [/]
     new_line = re.sub(r'(-\s*\[)[x /!](\])', fr'\1{status.strip("[]")}\2', target_line, count=1)
     
-    if new_line != target_line:
-        lines[best_idx] = new_line
-        with open(sprint_file, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
-        return True
-    
-    return True
+    lines[best_idx] = new_line
+    return best_idx
@@ -1,10 +1,11 @@
+import asyncio
 import os
 import re
 import subprocess
 import logging
 import functools
 from google.adk.tools import FunctionTool
-from sprint_utils import detect_latest_sprint_file
+from sprint_utils import detect_latest_sprint_file, format_blocker_reason, strip_blocker_tag
 import contextvars
 
 # Global Context for Messaging (manager, role, seen_ids)
@@ -705,6 +706,108 @@ async def update_sprint_task_status(
 
 
 
+class SprintStateWriter:
+    """
+    Owns the runner's task status writes to the latest sprint file.
+    
+    Workers submit (description, status, blocker_reason) updates; a background
+    task coalesces everything submitted within FLUSH_DELAY seconds (keeping the
+    last update per task) and applies the batch with a single locked
+    read/rewrite of the sprint file, instead of one full rewrite per update.
+    """
+    FLUSH_DELAY = 0.2
+    
+    def __init__(self, sprint_dir: str):
+        self.sprint_dir = sprint_dir
+        self._queue = asyncio.Queue()
+        self._pending = []
+        self._task = None
+    
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+    
+    async def submit(self, task_description: str, status: str, blocker_reason: str = None):
+        if status == "[!]" and not blocker_reason:
+            raise ValueError("blocker_reason is required when marking a task as [!]")
+        self._queue.put_nowait((task_description, status, blocker_reason))
+    
+    async def _run(self):
+        while True:
+            self._pending.append(await self._queue.get())
+            await asyncio.sleep(self.FLUSH_DELAY)
+            self.flush()
+    
+    def flush(self):
+        """Synchronously write the latest pending update for each task in one pass."""
+        batch, self._pending = self._pending, []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if not batch:
+            return
+        
+        # Only the last status submitted for a task matters
+        latest = {update[0]: update for update in batch}
+        
+        logger = logging.getLogger("SprintRunner")
+        from sprint_metadata import apply_task_status
+        
+        # Windows file locking, same as update_sprint_header
+        try:
+            import msvcrt
+        except ImportError:
+            msvcrt = None
+        
+        sprint_file = detect_latest_sprint_file(self.sprint_dir)
+        if not sprint_file:
+            logger.warning(f"[SprintStateWriter] No sprint file in {self.sprint_dir}; dropped {len(latest)} updates")
+            return
+        
+        try:
+            # Use r+ mode for atomic read-modify-write
+            with open(sprint_file, 'r+', encoding='utf-8') as f:
+                if msvcrt:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                try:
+                    lines = f.readlines()
+                    
+                    for task_description, status, blocker_reason in latest.values():
+                        idx = apply_task_status(lines, task_description, status)
+                        if idx < 0:
+                            logger.warning(f"[SprintStateWriter] Task '{task_description}' not found in {sprint_file}")
+                            continue
+                        if status != "[!]" and "[BLOCKED:" in lines[idx]:
+                            # A task that moved on keeps no stale blocker from an earlier attempt
+                            lines[idx] = strip_blocker_tag(lines[idx]) + "\n"
+                        elif blocker_reason and "[BLOCKED:" not in lines[idx]:
+                            lines[idx] = lines[idx].rstrip() + f" [BLOCKED: {format_blocker_reason(blocker_reason)}]\n"
+                    
+                    f.seek(0)
+                    f.writelines(lines)
+                    f.truncate()
+                finally:
+                    if msvcrt:
+                        try:
+                            f.seek(0)
+                            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+                        except OSError:
+                            pass
+        except Exception as e:
+            logger.error(f"[SprintStateWriter] Failed to write {len(latest)} updates: {e}")
+    
+    async def close(self):
+        """Stop the background task and write out anything still pending."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.flush()
+
+
 @log_async_tool_usage
 async def add_sprint_task(role: str, task_description: str, sprint_dir: str = "project_tracking"):
     """
@@ -1007,7 +1110,7 @@ async def enrich_task_context(task_description: str, context_data: dict, sprint_
 
 # --- Turn Budget Management Tools ---
 
-from sprint_metadata import parse_task_metadata, update_task_metadata_in_file
+from sprint_metadata import parse_task_metadata_all, update_task_metadata_in_file
 
 @log_tool_usage
 def request_turn_budget(task_description: str, estimated_turns: int, justification: str) -> dict:
@@ -1108,9 +1211,10 @@ def analyze_turn_metrics(sprint_file: str = None) -> dict:
     
     analyzed = []
     for task in tasks:
-        points = parse_task_metadata(task.get('desc', ''), 'POINTS')
-        used = parse_task_metadata(task.get('desc', ''), 'TURNS_USED')
-        estimated = parse_task_metadata(task.get('desc', ''), 'TURNS_ESTIMATED')
+        meta = parse_task_metadata_all(task.get('desc', ''))
+        points = meta.get('POINTS')
+        used = meta.get('TURNS_USED')
+        estimated = meta.get('TURNS_ESTIMATED')
         
         if points and used:
             variance = ((used - estimated) / estimated * 100) if estimated else 0
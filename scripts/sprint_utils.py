@@ -1,5 +1,17 @@
+import logging
 import os
 import re
+from collections import Counter
+from dataclasses import dataclass
+
+@dataclass(slots=True)
+class SprintTask:
+    """A pending task as handed to the execution phase"""
+    role: str
+    desc: str
+    status: str  # 'todo', 'in_progress' or 'blocked'
+    blocker_reason: str = None
+    reviewer_note: str = None  # Set when the Reviewer lets a task through with warnings
 
 def detect_latest_sprint_file(sprint_dir: str):
     """Finds the latest SPRINT_*.md file in the given directory, excluding reports."""
@@ -22,92 +34,20 @@ def parse_sprint_tasks(sprint_file_path: str):
     Returns a list of tasks with role, description, and status.
     Status values: "todo" ([ ]), "in_progress" ([/]), "blocked" ([!])
     """
-    tasks = []
     if not sprint_file_path or not os.path.exists(sprint_file_path):
         print(f"Error: Sprint file {sprint_file_path} not found.")
-        return tasks
-
-    with open(sprint_file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    # Split by headers (H1-H6) to process sections, but keep it simple for now.
-    # We'll just iterate line by line to support mixed formats better.
-    lines = content.split("\n")
-    
-    current_section_roles = []
-    
-    for line in lines:
-        line_stripped = line.strip()
-        
-        # 1. Check for Section Headers with Roles (e.g. "### @Backend Tasks")
-        if line_stripped.startswith("#"):
-            # Extract roles from header if any
-            found_roles = re.findall(r"@(\w+)", line_stripped)
-            if found_roles:
-                current_section_roles = found_roles
-            # Note: We don't clear roles on headers without roles, to allow 
-            # "### Sub-section" to inherit from "## @Role Section" if we were that advanced.
-            # But for now, let's keep it simple: strict scope or inline.
-            # Actually, standardizing: if a header triggers a new context, use it. 
-            # If no roles in header, maybe clear it? 
-            # For SPRINT_2.md logic (Epic headers have no roles), we rely on inline.
-            elif "Epic" in line_stripped or "Story" in line_stripped:
-                current_section_roles = [] # Reset for new Epic/Story if no explicit role in header
+        return []
 
-        # 2. Check for Task Items
-        # Matches: - [ ] ... or - [/] ... or - [!] ...
-        task_match = re.search(r"^\s*-\s*\[([ /!])\]\s*(.*)", line)
-        if task_match:
-            status_char = task_match.group(1)
-            full_desc = task_match.group(2).strip()
-            
-            # Check for inline role: "@DevOps: Do something" or "@Backend Do something"
-            # Regex: Start of description, @Role, optional colon, space
-            inline_role_match = re.match(r"^@(\w+)[:\s]\s*(.*)", full_desc)
-            
-            role = None
-            desc = full_desc
-            
-            if inline_role_match:
-                role = inline_role_match.group(1)
-                desc = inline_role_match.group(2)
-            elif current_section_roles:
-                role = current_section_roles[0]
-            
-            if role:
-                # Map status character to status string
-                status_map = {
-                    " ": "todo",
-                    "/": "in_progress",
-                    "!": "blocked"
-                }
-                status = status_map.get(status_char, "todo")
-                
-                # Extract blocker reason if present (format: "task desc [BLOCKED: reason]")
-                blocker_reason = None
-                if status == "blocked":
-                    blocker_match = re.search(r"\[BLOCKED:\s*(.+?)\]\s*$", desc)
-                    if blocker_match:
-                        blocker_reason = blocker_match.group(1).strip()
-                        # Remove blocker annotation from description
-                        desc = re.sub(r"\s*\[BLOCKED:.+?\]\s*$", "", desc).strip()
-                    else:
-                        # Log warning when blocked task is missing blocker reason
-                        import logging
-                        logging.getLogger("SprintRunner").warning(
-                            f"Blocked task missing blocker reason: '{desc}' (@{role}). "
-                            f"Use format: [BLOCKED: reason]"
-                        )
-                
-                # Only return pending, in-progress, or blocked tasks (skip completed [x])
-                tasks.append({
-                    "role": role,
-                    "desc": desc,
-                    "status": status,
-                    "blocker_reason": blocker_reason
-                })
-
-    return tasks
+    # Only return pending, in-progress, or blocked tasks (skip completed [x])
+    return [
+        {
+            "role": t.role,
+            "desc": t.desc,
+            "status": t.status,
+            "blocker_reason": t.blocker_reason
+        }
+        for t in _pending_tasks(get_all_sprint_tasks(sprint_file_path))
+    ]
 
 def get_all_sprint_tasks(sprint_file_path: str):
     """
@@ -175,8 +115,9 @@ def analyze_sprint_status(sprint_file_path: str):
     Analyzes the current status of a sprint file.
     Returns a summary dict with counts and lists of tasks by status.
     """
-    all_tasks = get_all_sprint_tasks(sprint_file_path)
-    
+    return _summarize_tasks(get_all_sprint_tasks(sprint_file_path))
+
+def _summarize_tasks(all_tasks):
     summary = {
         "total": len(all_tasks),
         "completed": 0,
@@ -189,19 +130,66 @@ def analyze_sprint_status(sprint_file_path: str):
         "in_progress_tasks": [],  # List of in-progress task details
     }
     
-    for task in all_tasks:
-        status = task["status"]
-        summary[status] = summary.get(status, 0) + 1
-        
-        if status == "blocked":
-            summary["blocked_tasks"].append({
-                "role": task["role"],
-                "desc": task["desc"]
-            })
-        elif status == "in_progress":
-            summary["in_progress_tasks"].append({
-                "role": task["role"],
-                "desc": task["desc"]
-            })
+    summary.update(Counter(task["status"] for task in all_tasks))
+    summary["blocked_tasks"] = [
+        {"role": t["role"], "desc": t["desc"]} for t in all_tasks if t["status"] == "blocked"
+    ]
+    summary["in_progress_tasks"] = [
+        {"role": t["role"], "desc": t["desc"]} for t in all_tasks if t["status"] == "in_progress"
+    ]
     
     return summary
+
+# Longest blocker reason written into a task line
+MAX_BLOCKER_REASON = 200
+
+def format_blocker_reason(reason) -> str:
+    """
+    Flattens a blocker reason so it fits inside one "[BLOCKED: ...]" tag:
+    newlines and whitespace runs become single spaces, "]" is dropped (it
+    would close the tag early) and the result is capped at MAX_BLOCKER_REASON.
+    """
+    return " ".join(str(reason).replace("]", "").split())[:MAX_BLOCKER_REASON].rstrip()
+
+def strip_blocker_tag(text: str) -> str:
+    """Removes a trailing "[BLOCKED: ...]" tag (and trailing whitespace) from a task line or description."""
+    return re.sub(r"\s*\[BLOCKED:.+?\]\s*$", "", text).rstrip()
+
+def _to_pending_task(task):
+    """Converts a get_all_sprint_tasks() entry into a SprintTask."""
+    desc = task["desc"]
+    blocker_reason = None
+    if task["status"] == "blocked":
+        # Extract blocker reason if present (format: "task desc [BLOCKED: reason]")
+        blocker_match = re.search(r"\[BLOCKED:\s*(.+?)\]\s*$", desc)
+        if blocker_match:
+            blocker_reason = blocker_match.group(1).strip()
+            # Remove blocker annotation from description
+            desc = strip_blocker_tag(desc).strip()
+        else:
+            # Log warning when blocked task is missing blocker reason
+            logging.getLogger("SprintRunner").warning(
+                f"Blocked task missing blocker reason: '{desc}' (@{task['role']}). "
+                f"Use format: [BLOCKED: reason]"
+            )
+    return SprintTask(task["role"], desc, task["status"], blocker_reason)
+
+def _pending_tasks(all_tasks):
+    """The todo, in-progress and blocked entries of all_tasks, as SprintTasks."""
+    return [
+        _to_pending_task(t) for t in all_tasks
+        if t["status"] in ("todo", "in_progress", "blocked")
+    ]
+
+def parse_sprint_file_once(sprint_file_path: str):
+    """
+    Reads and parses the sprint file a single time.
+    Returns (status_summary, pending_tasks), equivalent to calling
+    analyze_sprint_status() and parse_sprint_tasks() on the same file,
+    with the pending tasks as SprintTask objects rather than dicts.
+    """
+    if not sprint_file_path or not os.path.exists(sprint_file_path):
+        print(f"Error: Sprint file {sprint_file_path} not found.")
+        return _summarize_tasks([]), []
+    all_tasks = get_all_sprint_tasks(sprint_file_path)
+    return _summarize_tasks(all_tasks), _pending_tasks(all_tasks)
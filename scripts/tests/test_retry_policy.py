@@ -0,0 +1,49 @@
+import unittest
+import sys
+import os
+from datetime import timedelta
+from types import SimpleNamespace
+
+# Add scripts dir to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parallel_sprint_runner import get_retry_after_seconds, _MAX_SERVER_RETRY_WAIT
+
+
+class TestRetryAfter(unittest.TestCase):
+
+    def _http_error(self, retry_after):
+        error = Exception("429 Too Many Requests")
+        error.response = SimpleNamespace(headers={"Retry-After": retry_after})
+        return error
+
+    def test_header_delay_is_used(self):
+        self.assertEqual(get_retry_after_seconds(self._http_error("30")), 30.0)
+
+    def test_long_header_delay_is_honoured(self):
+        self.assertEqual(get_retry_after_seconds(self._http_error("300")), 300.0)
+
+    def test_long_retry_delay_is_honoured(self):
+        error = Exception("ResourceExhausted")
+        error.retry_delay = timedelta(seconds=300)
+        self.assertEqual(get_retry_after_seconds(error), 300.0)
+
+    def test_large_header_delay_is_capped(self):
+        self.assertEqual(get_retry_after_seconds(self._http_error("3600")), _MAX_SERVER_RETRY_WAIT)
+
+    def test_large_retry_delay_is_capped(self):
+        error = Exception("ResourceExhausted")
+        error.retry_delay = timedelta(hours=1)
+        self.assertEqual(get_retry_after_seconds(error), _MAX_SERVER_RETRY_WAIT)
+
+    def test_large_retry_info_detail_is_capped(self):
+        error = Exception("RESOURCE_EXHAUSTED")
+        error.details = {"error": {"details": [{"retryDelay": "86400s"}]}}
+        self.assertEqual(get_retry_after_seconds(error), _MAX_SERVER_RETRY_WAIT)
+
+    def test_no_hint(self):
+        self.assertIsNone(get_retry_after_seconds(Exception("429")))
+
+
+if __name__ == "__main__":
+    unittest.main()
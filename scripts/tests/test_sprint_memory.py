@@ -89,6 +89,21 @@ class TestSprintMemory(unittest.TestCase):
         # Let's just check relative relevant result is first.
         self.assertIn("Port", results[0]['content'])
     
+    def test_recall_batch(self):
+        """Test batched recall returns one result list per query, in order"""
+        self.memory.store("Port 5173 occupied by zombie process", memory_type="error_resolution")
+        self.memory.store("Database connection timeout after 30s", memory_type="error_resolution")
+        
+        batches = self.memory.recall_batch(["process blocking port", "database timeout"], top_k=1)
+        
+        self.assertEqual(len(batches), 2)
+        self.assertIn("Port", batches[0][0]['content'])
+        self.assertIn("Database", batches[1][0]['content'])
+        
+        # Batched and single recall should agree
+        single = self.memory.recall("database timeout", top_k=1)
+        self.assertEqual(single[0]['memory_id'], batches[1][0]['memory_id'])
+    
     def test_statistics(self):
         """Test memory bank statistics"""
         # Store various memories
@@ -117,6 +132,9 @@ class TestSprintMemory(unittest.TestCase):
         results = disabled_memory.recall("Test")
         self.assertEqual(results, [])
         
+        batches = disabled_memory.recall_batch(["Test", "Other"])
+        self.assertEqual(batches, [[], []])
+        
         stats = disabled_memory.get_statistics()
         self.assertFalse(stats['enabled'])
 
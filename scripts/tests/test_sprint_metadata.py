@@ -0,0 +1,29 @@
+import unittest
+import sys
+import os
+
+# Add scripts dir to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sprint_metadata import parse_task_metadata, parse_task_metadata_all
+
+
+class TestParseTaskMetadata(unittest.TestCase):
+
+    def test_first_group(self):
+        desc = "Build login [POINTS:8|TURNS_ESTIMATED:60|NOTE:wip]"
+        self.assertEqual(
+            parse_task_metadata_all(desc),
+            {"POINTS": 8, "TURNS_ESTIMATED": 60, "NOTE": "wip"}
+        )
+        self.assertEqual(parse_task_metadata(desc, "turns_estimated"), 60)
+
+    def test_later_groups_are_ignored(self):
+        desc = "Build login [POINTS:8] [BLOCKED: Port 5173 busy] [TURNS_USED:12]"
+        self.assertEqual(parse_task_metadata_all(desc), {"POINTS": 8})
+        self.assertIsNone(parse_task_metadata(desc, "BLOCKED"))
+        self.assertEqual(parse_task_metadata(desc, "TURNS_USED", 0), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
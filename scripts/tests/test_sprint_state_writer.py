@@ -0,0 +1,56 @@
+import unittest
+import asyncio
+import sys
+import os
+import tempfile
+
+# Add scripts dir to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sprint_tools import SprintStateWriter
+from sprint_utils import get_all_sprint_tasks, parse_sprint_tasks
+
+
+class TestSprintStateWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.sprint_dir = tempfile.mkdtemp()
+        self.sprint_file = os.path.join(self.sprint_dir, "SPRINT_1.md")
+        with open(self.sprint_file, "w", encoding="utf-8") as f:
+            f.write("## @Backend Tasks\n- [ ] Build the login API endpoint\n- [ ] Add logout\n")
+
+    def _write(self, *updates):
+        writer = SprintStateWriter(self.sprint_dir)
+
+        async def submit_all():
+            for update in updates:
+                await writer.submit(*update)
+            writer.flush()
+
+        asyncio.run(submit_all())
+
+    def _task(self, desc_prefix):
+        return next(t for t in get_all_sprint_tasks(self.sprint_file) if t["desc"].startswith(desc_prefix))
+
+    def test_multiline_blocker_reason_stays_on_one_line(self):
+        self._write(("Build the login API endpoint", "[!]", "Agent failed: boom\n- [ ] bar] baz"))
+
+        tasks = get_all_sprint_tasks(self.sprint_file)
+        self.assertEqual(len(tasks), 2)
+        task = self._task("Build the login API endpoint")
+        self.assertEqual(task["status"], "blocked")
+        self.assertEqual(task["desc"], "Build the login API endpoint [BLOCKED: Agent failed: boom - [ bar baz]")
+        blocked = parse_sprint_tasks(self.sprint_file)[0]
+        self.assertEqual(blocked["blocker_reason"], "Agent failed: boom - [ bar baz")
+
+    def test_stale_blocker_tag_is_dropped_when_task_passes_on_retry(self):
+        self._write(("Build the login API endpoint", "[!]", "Agent failed: boom"))
+        self._write(("Build the login API endpoint", "[x]"))
+
+        task = self._task("Build the login API endpoint")
+        self.assertEqual(task["status"], "done")
+        self.assertEqual(task["desc"], "Build the login API endpoint")
+
+
+if __name__ == "__main__":
+    unittest.main()